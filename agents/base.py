@@ -4,19 +4,33 @@ Base agent class for all trading agents.
 
 import asyncio
 import logging
+import random
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional, Any
+from typing import ClassVar, Optional, Any
 
 from agents.llm import LLMClient
 from agents.report import ReportManager
-from agents.market_schedule import is_any_market_active
+from agents.market_schedule import is_any_market_active, seconds_until_next_open
 
 logger = logging.getLogger(__name__)
 
 
+def _jittered(interval_seconds: float) -> float:
+    """Add up to 10% random delay so agents with aligned intervals don't hit the APIs together."""
+    return interval_seconds + random.uniform(0, interval_seconds * 0.1)
+
+
 class BaseAgent(ABC):
-    """Abstract base class for all trading agents."""
+    """Abstract base class for all trading agents.
+
+    Each agent runs as its own asyncio task (see main.py), so agents' LLM and
+    KIS calls overlap. A semaphore shared by all agents caps how many cycles
+    run at once (config.max_concurrent_cycles) to stay within API quotas.
+    """
+
+    # Shared across all agents; created by the first agent constructed
+    _cycle_semaphore: ClassVar[Optional[asyncio.Semaphore]] = None
 
     def __init__(
         self,
@@ -27,12 +41,14 @@ class BaseAgent(ABC):
         self.name = name
         self.config = config
         self.kis = kis_client
-        self.llm = LLMClient(config)
+        self.llm = LLMClient.get(config)
         self.report_manager = ReportManager(name)
         self.status = "idle"  # idle | running | error
         self.last_run: Optional[datetime] = None
         self.last_error: Optional[str] = None
         self._ws_manager: Optional[Any] = None  # set by main.py for broadcasting events
+        if BaseAgent._cycle_semaphore is None:
+            BaseAgent._cycle_semaphore = asyncio.Semaphore(config.max_concurrent_cycles)
 
     @abstractmethod
     async def run_cycle(self) -> dict:
@@ -51,18 +67,22 @@ class BaseAgent(ABC):
         Args:
             interval_seconds: Time to wait between cycles (default: 60s)
         """
-        logger.info(f"Agent {self.name} starting with {interval_seconds}s interval")
+        logger.info("Agent %s starting with %ds interval", self.name, interval_seconds)
         while True:
             # Skip cycle if no market is active (outside pre-scan + trading hours)
             if not is_any_market_active():
                 if self.status != "idle":
                     self.status = "idle"
-                    logger.info(f"Agent {self.name} sleeping - markets closed")
+                    logger.info("Agent %s sleeping - markets closed", self.name)
                     if self._ws_manager:
                         await self._ws_manager.broadcast(
                             "agent_status_changed", self.get_status()
                         )
-                await asyncio.sleep(interval_seconds)
+                # Sleep until the next session opens, capped so config/override
+                # changes still get picked up within a few intervals
+                await asyncio.sleep(
+                    min(interval_seconds * 10, max(seconds_until_next_open(), 1.0))
+                )
                 continue
 
             self.status = "running"
@@ -71,11 +91,13 @@ class BaseAgent(ABC):
                     "agent_status_changed", self.get_status()
                 )
             try:
-                result = await self.run_cycle()
-                report_path = self.report_manager.write_report(result)
-                self.last_run = datetime.now()
+                async with self._cycle_semaphore:
+                    result = await self.run_cycle()
+                now = datetime.now()
+                report_path = await self.report_manager.write_report_async(result, now)
+                self.last_run = now
                 self.status = "idle"
-                logger.info(f"Agent {self.name} cycle complete: {report_path}")
+                logger.info("Agent %s cycle complete: %s", self.name, report_path)
 
                 # Broadcast event if ws_manager available
                 if self._ws_manager:
@@ -88,15 +110,15 @@ class BaseAgent(ABC):
             except Exception as e:
                 self.status = "error"
                 self.last_error = str(e)
-                logger.error(f"Agent {self.name} error: {e}", exc_info=True)
+                logger.error("Agent %s error: %s", self.name, e, exc_info=True)
                 if self._ws_manager:
                     await self._ws_manager.broadcast(
                         "agent_status_changed", self.get_status()
                     )
 
-            await asyncio.sleep(interval_seconds)
+            await asyncio.sleep(_jittered(interval_seconds))
 
-    def read_other_reports(self, agent_name: str, n: int = 3) -> list[str]:
+    async def read_other_reports(self, agent_name: str, n: int = 3) -> list[str]:
         """
         Read recent reports from another agent.
 
@@ -107,7 +129,7 @@ class BaseAgent(ABC):
         Returns:
             list[str]: List of report contents
         """
-        return self.report_manager.read_reports(agent_name, n)
+        return await self.report_manager.read_reports_async(agent_name, n)
 
     def get_status(self) -> dict:
         """
@@ -2,11 +2,12 @@
 Data Analyst Agent - reads collector snapshots and generates LLM-driven trading signals.
 """
 
-import json
 import logging
+from collections import OrderedDict
 from typing import Any
 
 from agents.base import BaseAgent
+from agents.report import format_json
 
 logger = logging.getLogger(__name__)
 
@@ -33,15 +34,38 @@ class DataAnalystAgent(BaseAgent):
         '"market_outlook": "...", "reasoning": "..."}'
     )
 
+    RESPONSE_SCHEMA = {
+        "type": "object",
+        "required": ["signals"],
+        "properties": {
+            "signals": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["stock_code", "action"],
+                    "properties": {
+                        "stock_code": {"type": "string"},
+                        "action": {"enum": ["buy", "sell", "hold"]},
+                        "confidence": {"type": "number"},
+                        "reasoning": {"type": "string"},
+                    },
+                },
+            },
+            "market_outlook": {"type": "string"},
+            "reasoning": {"type": "string"},
+        },
+    }
+
     def __init__(self, name: str, config: Any, kis_client: Any) -> None:
         super().__init__(name, config, kis_client)
+        self.llm.register_schema(self.name, self.RESPONSE_SCHEMA)
 
     async def run_cycle(self) -> dict:
         """Read collector reports, ask LLM for analysis, return structured signals."""
 
         # 1. Gather context from other agents
-        collector_reports = self.read_other_reports("data_collector", 3)
-        risk_reports = self.read_other_reports("risk_manager", 1)
+        collector_reports = await self.read_other_reports("data_collector", 3)
+        risk_reports = await self.read_other_reports("risk_manager", 1)
 
         if not collector_reports:
             logger.warning("No collector reports available - analysis may be limited")
@@ -50,7 +74,7 @@ class DataAnalystAgent(BaseAgent):
         context = _build_analysis_context(collector_reports, risk_reports)
 
         # 3. Get LLM analysis (JSON mode)
-        analysis = await self.llm.ask_json(self.SYSTEM_PROMPT, context)
+        analysis = await self.llm.ask_json_schema(self.SYSTEM_PROMPT, context, self.name)
 
         signals = analysis.get("signals", [])
         market_outlook = analysis.get("market_outlook", "N/A")
@@ -64,10 +88,10 @@ class DataAnalystAgent(BaseAgent):
 
         return {
             "summary": f"Generated {len(signals)} signal(s). Outlook: {market_outlook}",
-            "data": json.dumps(analysis, indent=2, ensure_ascii=False),
+            "data": format_json(analysis),
             "llm_decision": reasoning,
             "actions": "Analyzed market data and generated trading signals",
-            "recommendations": json.dumps(signals, indent=2, ensure_ascii=False),
+            "recommendations": format_json(signals),
         }
 
 
@@ -76,11 +100,34 @@ class DataAnalystAgent(BaseAgent):
 # ------------------------------------------------------------------
 
 
+# Recently built prompts, keyed by their input reports (reports rarely change between cycles)
+_CONTEXT_CACHE: OrderedDict[tuple, str] = OrderedDict()
+_CONTEXT_CACHE_SIZE = 8
+
+
 def _build_analysis_context(
     collector_reports: list[str],
     risk_reports: list[str],
 ) -> str:
     """Combine collector data and risk constraints into a single prompt."""
+    key = (tuple(collector_reports), tuple(risk_reports))
+    cached = _CONTEXT_CACHE.get(key)
+    if cached is not None:
+        _CONTEXT_CACHE.move_to_end(key)
+        return cached
+
+    context = _assemble_analysis_context(collector_reports, risk_reports)
+    _CONTEXT_CACHE[key] = context
+    if len(_CONTEXT_CACHE) > _CONTEXT_CACHE_SIZE:
+        _CONTEXT_CACHE.popitem(last=False)
+    return context
+
+
+def _assemble_analysis_context(
+    collector_reports: list[str],
+    risk_reports: list[str],
+) -> str:
+    """Build the analysis prompt string (uncached)."""
     parts: list[str] = []
 
     parts.append("## Recent Market Data\n")
@@ -2,42 +2,48 @@
 Data Collector Agent - gathers market data and produces LLM-summarized snapshots.
 """
 
-import json
+import asyncio
+import io
 import logging
+import operator
 from typing import Any
 
 from agents.base import BaseAgent
+from agents.report import format_json
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates for DataCollectorAgent._build_context
+_STOCK_TEMPLATE = (
+    "### Stock {0}\n"
+    "- Current price: {current_price}  Change: {change_rate_pct}%\n"
+    "- Open: {open}  High: {high}  Low: {low}\n"
+    "- Volume: {volume}\n\n"
+)
+_DAILY_TEMPLATE = "  %s: O=%s H=%s L=%s C=%s Vol=%s Chg=%s%%\n"
+
+
+# KIS model attribute -> plain dict key mappings for LLM context
+_PRICE_KEYS = (
+    "current_price", "open", "high", "low", "volume", "change_rate_pct", "change_amount",
+)
+_PRICE_ATTRS = operator.attrgetter(
+    "stck_prpr", "stck_oprc", "stck_hgpr", "stck_lwpr", "acml_vol", "prdy_ctrt", "prdy_vrss",
+)
+_DAILY_KEYS = ("date", "open", "high", "low", "close", "volume", "change_rate_pct")
+_DAILY_ATTRS = operator.attrgetter(
+    "stck_bsop_date", "stck_oprc", "stck_hgpr", "stck_lwpr", "stck_clpr", "acml_vol", "prdy_ctrt",
+)
+
 
 def _format_price(price: Any) -> dict:
     """Convert a StockPrice model to a plain dict for LLM context."""
-    return {
-        "current_price": price.stck_prpr,
-        "open": price.stck_oprc,
-        "high": price.stck_hgpr,
-        "low": price.stck_lwpr,
-        "volume": price.acml_vol,
-        "change_rate_pct": price.prdy_ctrt,
-        "change_amount": price.prdy_vrss,
-    }
+    return dict(zip(_PRICE_KEYS, _PRICE_ATTRS(price)))
 
 
 def _format_daily(daily_list: list) -> list[dict]:
     """Convert a list of DailyPrice models to plain dicts."""
-    return [
-        {
-            "date": d.stck_bsop_date,
-            "open": d.stck_oprc,
-            "high": d.stck_hgpr,
-            "low": d.stck_lwpr,
-            "close": d.stck_clpr,
-            "volume": d.acml_vol,
-            "change_rate_pct": d.prdy_ctrt,
-        }
-        for d in daily_list
-    ]
+    return [dict(zip(_DAILY_KEYS, _DAILY_ATTRS(d))) for d in daily_list]
 
 
 class DataCollectorAgent(BaseAgent):
@@ -59,20 +65,34 @@ class DataCollectorAgent(BaseAgent):
         """Collect market data for every stock on the watchlist and summarize via LLM."""
 
         # 1. Read risk-manager reports for any watchlist / constraint adjustments
-        risk_reports = self.read_other_reports("risk_manager", 1)
+        risk_reports = await self.read_other_reports("risk_manager", 1)
 
         # 2. Gather current price + recent daily prices for each stock
-        market_data: dict[str, dict] = {}
-        for code in self.config.watchlist:
-            try:
-                price = await self.kis.get_price(code)
-                daily = await self.kis.get_daily_prices(code, count=5)
-                market_data[code] = {
-                    "current": _format_price(price),
-                    "daily": _format_daily(daily),
-                }
-            except Exception as e:
-                logger.warning("Failed to get data for %s: %s", code, e)
+        #    Quotes come from one batched request where KIS supports it; daily
+        #    history is fetched per stock, concurrently (bounded by
+        #    max_concurrent_kis). KISClient still spaces out the actual HTTP calls
+        #    for rate limiting.
+        watchlist = self.config.watchlist  # replaced, never mutated, on edits
+        try:
+            prices = await self.kis.get_prices_batch(watchlist)
+        except Exception as e:
+            logger.warning("Batch price fetch failed, falling back to per-stock: %s", e)
+            prices = None
+
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_kis)
+        if prices is None:
+            fetches = [self._fetch_stock(code, semaphore) for code in watchlist]
+        else:
+            # The batch already tried each code on its own (and logged failures);
+            # a code missing from it is skipped rather than requested again
+            fetches = [
+                self._fetch_stock(code, semaphore, prices[code])
+                for code in watchlist if code in prices
+            ]
+        results = await asyncio.gather(*fetches)
+        market_data: dict[str, dict] = {
+            code: info for code, info in results if info is not None
+        }
 
         if not market_data:
             logger.warning("No market data collected this cycle")
@@ -84,12 +104,12 @@ class DataCollectorAgent(BaseAgent):
         llm_summary = await self.llm.ask(self.SYSTEM_PROMPT, context)
 
         # 5. Return structured report data (consumed by BaseAgent.run -> ReportManager)
-        formatted_data = json.dumps(market_data, indent=2, ensure_ascii=False)
+        formatted_data = format_json(market_data)
         return {
             "summary": llm_summary,
             "data": formatted_data,
             "llm_decision": llm_summary,
-            "actions": f"Collected market data for {len(market_data)}/{len(self.config.watchlist)} watchlist stocks",
+            "actions": f"Collected market data for {len(market_data)}/{len(watchlist)} watchlist stocks",
             "recommendations": "See summary for market highlights",
         }
 
@@ -97,30 +117,51 @@ class DataCollectorAgent(BaseAgent):
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _fetch_stock(
+        self, code: str, semaphore: asyncio.Semaphore, price: Any = None
+    ) -> tuple[str, dict | None]:
+        """Fetch recent daily prices (and the quote, if not batched) for one stock; None on failure."""
+        async with semaphore:
+            try:
+                if price is None:
+                    price, daily = await asyncio.gather(
+                        self.kis.get_price(code),
+                        self.kis.get_daily_prices(code, count=5),
+                    )
+                else:
+                    daily = await self.kis.get_daily_prices(code, count=5)
+            except Exception as e:
+                logger.warning("Failed to get data for %s: %s", code, e)
+                return code, None
+        return code, {
+            "current": _format_price(price),
+            "daily": _format_daily(daily),
+        }
+
     @staticmethod
     def _build_context(market_data: dict, risk_reports: list[str]) -> str:
         """Assemble the LLM user-prompt from raw data and risk context."""
-        parts: list[str] = ["## Current Market Data\n"]
+        # Every piece is newline-terminated; the final newline is dropped on return.
+        buf = io.StringIO()
+        buf.write("## Current Market Data\n\n")
 
         for code, info in market_data.items():
-            cur = info["current"]
-            parts.append(
-                f"### Stock {code}\n"
-                f"- Current price: {cur['current_price']}  Change: {cur['change_rate_pct']}%\n"
-                f"- Open: {cur['open']}  High: {cur['high']}  Low: {cur['low']}\n"
-                f"- Volume: {cur['volume']}\n"
-            )
+            buf.write(_STOCK_TEMPLATE.format(code, **info["current"]))
             if info["daily"]:
-                parts.append("Recent daily history:")
-                for d in info["daily"]:
-                    parts.append(
-                        f"  {d['date']}: O={d['open']} H={d['high']} L={d['low']} "
-                        f"C={d['close']} Vol={d['volume']} Chg={d['change_rate_pct']}%"
+                buf.write("Recent daily history:\n")
+                buf.writelines(
+                    _DAILY_TEMPLATE % (
+                        d["date"], d["open"], d["high"], d["low"],
+                        d["close"], d["volume"], d["change_rate_pct"],
                     )
-            parts.append("")
+                    for d in info["daily"]
+                )
+            buf.write("\n")
 
         if risk_reports:
-            parts.append("## Risk Manager Notes\n")
-            parts.extend(risk_reports)
+            buf.write("## Risk Manager Notes\n\n")
+            for report in risk_reports:
+                buf.write(report)
+                buf.write("\n")
 
-        return "\n".join(parts)
+        return buf.getvalue()[:-1]
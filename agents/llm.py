@@ -2,10 +2,17 @@
 LLM client for agent decision-making.
 """
 
+import copy
+import hashlib
 import json
 import logging
-from typing import Any
+import time
+from collections import OrderedDict
+from typing import Any, Callable, ClassVar
 
+import fastjsonschema
+import httpx
+import orjson
 from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
@@ -14,15 +21,50 @@ logger = logging.getLogger(__name__)
 class LLMClient:
     """Client for interacting with OpenAI's API."""
 
+    # Shared instances keyed by (api_key, model) so all agents reuse one connection pool
+    _instances: ClassVar[dict[tuple[str, str], "LLMClient"]] = {}
+
+    # Exact-match response cache size (entries)
+    _CACHE_MAXSIZE = 512
+
     def __init__(self, config: Any) -> None:
         """
         Initialize LLM client.
 
         Args:
-            config: Configuration object with openai_api_key and openai_model
+            config: Configuration object with openai_api_key, openai_model and llm_cache_ttl
         """
-        self.client = AsyncOpenAI(api_key=config.openai_api_key)
+        self.client = AsyncOpenAI(
+            api_key=config.openai_api_key,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            ),
+        )
         self.model = config.openai_model
+        # Identical prompts within the TTL reuse the previous response (0 disables)
+        self.cache_ttl: float = config.llm_cache_ttl
+        self._cache: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+        # Compiled JSON-schema validators by name (compiled once, reused for every call)
+        self._validators: dict[str, Callable[[Any], Any]] = {}
+
+    @classmethod
+    def get(cls, config: Any) -> "LLMClient":
+        """
+        Return the shared LLM client for this config's credentials and model.
+
+        Args:
+            config: Configuration object with openai_api_key, openai_model and llm_cache_ttl
+
+        Returns:
+            LLMClient: Instance shared by every caller with the same key and model
+        """
+        key = (config.openai_api_key, config.openai_model)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls(config)
+            cls._instances[key] = instance
+        return instance
 
     async def ask(self, system_prompt: str, user_prompt: str) -> str:
         """
@@ -35,6 +77,11 @@ class LLMClient:
         Returns:
             str: The LLM's text response
         """
+        key = self._cache_key("text", system_prompt, user_prompt)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
             response = await self.client.chat.completions.create(
                 model=self.model,
@@ -43,11 +90,14 @@ class LLMClient:
                     {"role": "user", "content": user_prompt},
                 ],
             )
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
         except Exception as e:
-            logger.error(f"LLM ask error: {e}", exc_info=True)
+            logger.error("LLM ask error: %s", e, exc_info=True)
             raise
 
+        self._cache_put(key, content)
+        return content
+
     async def ask_json(self, system_prompt: str, user_prompt: str) -> dict:
         """
         JSON mode response. Returns parsed dict.
@@ -59,6 +109,12 @@ class LLMClient:
         Returns:
             dict: Parsed JSON response from the LLM
         """
+        key = self._cache_key("json", system_prompt, user_prompt)
+        cached = self._cache_get(key)
+        if cached is not None:
+            # Callers may mutate the result; never hand out the cached object itself
+            return copy.deepcopy(cached)
+
         try:
             response = await self.client.chat.completions.create(
                 model=self.model,
@@ -72,10 +128,98 @@ class LLMClient:
                 response_format={"type": "json_object"},
             )
             content = response.choices[0].message.content
-            return json.loads(content)
+            result = orjson.loads(content)
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM JSON response: {e}", exc_info=True)
+            logger.error("Failed to parse LLM JSON response: %s; content: %.500s", e, content)
             raise
         except Exception as e:
-            logger.error(f"LLM ask_json error: {e}", exc_info=True)
+            logger.error("LLM ask_json error: %s", e, exc_info=True)
             raise
+
+        self._cache_put(key, copy.deepcopy(result))
+        return result
+
+    def register_schema(self, name: str, schema: dict) -> None:
+        """
+        Compile a JSON schema for use with ask_json_schema (no-op if already registered).
+
+        Args:
+            name: Name to reference the schema by
+            schema: JSON schema dict
+        """
+        if name not in self._validators:
+            self._validators[name] = fastjsonschema.compile(schema)
+
+    async def ask_json_schema(self, system_prompt: str, user_prompt: str, schema_name: str) -> dict:
+        """
+        JSON mode response validated against a registered schema.
+
+        An invalid response is re-asked once with the validation error appended
+        to the user prompt.
+
+        Args:
+            system_prompt: System instructions for the LLM
+            user_prompt: User query or task description
+            schema_name: Name passed to register_schema
+
+        Returns:
+            dict: Parsed JSON response that satisfies the schema, or an empty dict
+                  if the retried response is still invalid (callers default every key)
+        """
+        validate = self._validators[schema_name]
+        result = await self.ask_json(system_prompt, user_prompt)
+        try:
+            validate(result)
+            return result
+        except fastjsonschema.JsonSchemaException as e:
+            logger.warning("LLM response failed %s schema: %s - retrying", schema_name, e.message)
+            # Don't let the invalid response be served from the cache next cycle
+            self._cache.pop(self._cache_key("json", system_prompt, user_prompt), None)
+            retry_prompt = (
+                f"{user_prompt}\n\n"
+                f"Your previous response was invalid: {e.message}. "
+                "Respond again with JSON that follows the required format exactly."
+            )
+
+        result = await self.ask_json(system_prompt, retry_prompt)
+        try:
+            validate(result)
+        except fastjsonschema.JsonSchemaException as e:
+            logger.error("LLM response failed %s schema after retry: %s", schema_name, e.message)
+            self._cache.pop(self._cache_key("json", system_prompt, retry_prompt), None)
+            # Degrade to "no decision" rather than failing the agent's whole cycle
+            return {}
+        return result
+
+    # ------------------------------------------------------------------
+    # Response cache
+    # ------------------------------------------------------------------
+
+    def _cache_key(self, mode: str, system_prompt: str, user_prompt: str) -> bytes:
+        """Hash the model, response mode and prompts into a cache key."""
+        raw = f"{self.model}\x00{mode}\x00{system_prompt}\x00{user_prompt}"
+        return hashlib.sha256(raw.encode("utf-8")).digest()
+
+    def _cache_get(self, key: bytes) -> Any:
+        """Return a fresh cached response, or None on miss/expiry."""
+        if self.cache_ttl <= 0:
+            return None
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        logger.debug("LLM cache hit")
+        return value
+
+    def _cache_put(self, key: bytes, value: Any) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        if self.cache_ttl <= 0 or value is None:
+            return
+        self._cache[key] = (time.monotonic(), value)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
@@ -9,8 +9,10 @@ KR (KRX):  Pre-scan 08:30, Open 09:00, Close 15:30 KST  (weekdays)
 US (NYSE): Pre-scan 09:00, Open 09:30, Close 16:00 ET   (weekdays)
 """
 
-from datetime import datetime, time
+import time
+from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 KST = ZoneInfo("Asia/Seoul")
@@ -23,22 +25,26 @@ class MarketPhase(str, Enum):
     CLOSED = "closed"
 
 
+# Market times are HHMM integers; every boundary falls on a whole minute,
+# so minute resolution is exact.
+
 # KR market times (KST)
-KR_PRE_SCAN_START = time(8, 30)
-KR_OPEN = time(9, 0)
-KR_CLOSE = time(15, 30)
+KR_PRE_SCAN_START = 830
+KR_OPEN = 900
+KR_CLOSE = 1530
 
 # US market times (ET)
-US_PRE_SCAN_START = time(9, 0)
-US_OPEN = time(9, 30)
-US_CLOSE = time(16, 0)
+US_PRE_SCAN_START = 900
+US_OPEN = 930
+US_CLOSE = 1600
 
 
-def _phase(now_time: time, pre_scan: time, mkt_open: time, mkt_close: time) -> MarketPhase:
+def _phase(now: datetime, pre_scan: int, mkt_open: int, mkt_close: int) -> MarketPhase:
     """Determine market phase for a given local time."""
-    if pre_scan <= now_time < mkt_open:
+    hhmm = now.hour * 100 + now.minute
+    if pre_scan <= hhmm < mkt_open:
         return MarketPhase.PRE_SCAN
-    if mkt_open <= now_time < mkt_close:
+    if mkt_open <= hhmm < mkt_close:
         return MarketPhase.OPEN
     return MarketPhase.CLOSED
 
@@ -52,7 +58,7 @@ def get_kr_phase(now: datetime | None = None) -> MarketPhase:
     # Weekends
     if now.weekday() >= 5:
         return MarketPhase.CLOSED
-    return _phase(now.time(), KR_PRE_SCAN_START, KR_OPEN, KR_CLOSE)
+    return _phase(now, KR_PRE_SCAN_START, KR_OPEN, KR_CLOSE)
 
 
 def get_us_phase(now: datetime | None = None) -> MarketPhase:
@@ -64,16 +70,47 @@ def get_us_phase(now: datetime | None = None) -> MarketPhase:
     # Weekends
     if now.weekday() >= 5:
         return MarketPhase.CLOSED
-    return _phase(now.time(), US_PRE_SCAN_START, US_OPEN, US_CLOSE)
+    return _phase(now, US_PRE_SCAN_START, US_OPEN, US_CLOSE)
 
 
 def is_any_market_active(now: datetime | None = None) -> bool:
     """Return True if either KR or US market is in pre-scan or open phase."""
+    if now is None:
+        return _active_for_minute(int(time.time() // 60))
     kr = get_kr_phase(now)
     us = get_us_phase(now)
     return kr != MarketPhase.CLOSED or us != MarketPhase.CLOSED
 
 
+@lru_cache(maxsize=4)
+def _active_for_minute(epoch_minute: int) -> bool:
+    """Market activity for a given epoch minute (phases only change on minute boundaries)."""
+    return is_any_market_active(datetime.fromtimestamp(epoch_minute * 60, KST))
+
+
+def _seconds_until_pre_scan(now: datetime, pre_scan: int) -> float:
+    """Seconds from now (market-local datetime) to the next weekday pre-scan start."""
+    candidate = now.replace(hour=pre_scan // 100, minute=pre_scan % 100, second=0, microsecond=0)
+    if candidate <= now:
+        candidate += timedelta(days=1)
+    while candidate.weekday() >= 5:
+        candidate += timedelta(days=1)
+    # Compare as timestamps so DST transitions are accounted for
+    return candidate.timestamp() - now.timestamp()
+
+
+def seconds_until_next_open(now: datetime | None = None) -> float:
+    """Return seconds until the next KR or US pre-scan window starts (0 if one is active)."""
+    if now is None:
+        now = datetime.now(KST)
+    if is_any_market_active(now):
+        return 0.0
+    return min(
+        _seconds_until_pre_scan(now.astimezone(KST), KR_PRE_SCAN_START),
+        _seconds_until_pre_scan(now.astimezone(ET), US_PRE_SCAN_START),
+    )
+
+
 def get_market_status(now: datetime | None = None) -> dict:
     """Return a dict describing both markets' current status (for the API)."""
     if now is None:
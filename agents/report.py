@@ -2,10 +2,95 @@
 Report management for agent outputs.
 """
 
+import asyncio
+import heapq
 import os
-from datetime import datetime
+import struct
+from collections import ChainMap
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+import orjson
+import zstandard
+
+
+@lru_cache(maxsize=256)
+def _read_report_text(path: str, mtime_ns: int, size: int) -> str:
+    """Read a report file, memoized by (path, mtime, size) so unchanged files skip disk I/O."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _read_report(path: Path) -> str:
+    """Read a report file through the stat-keyed cache."""
+    st = path.stat()
+    return _read_report_text(str(path), st.st_mtime_ns, st.st_size)
+
+
+def format_json(obj: Any) -> str:
+    """Pretty-print a payload for a report section (2-space indent, UTF-8 kept as-is)."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
+def join_reports(reports: list[str], default: str) -> str:
+    """Join reports with a separator, or return default when there are none."""
+    return "\n---\n".join(reports) if reports else default
+
+
+# Report filenames are timestamps, so lexicographic order == chronological order
+_FILENAME_FORMAT = "%Y-%m-%d_%H-%M-%S"
+
+
+def _report_names(agent_dir: Path, n: int | None = None) -> list[str]:
+    """Return report filenames in agent_dir, newest first (only the newest n if given)."""
+    with os.scandir(agent_dir) as it:
+        names = (e.name for e in it if e.name.endswith(".md"))
+        if n is None:
+            return sorted(names, reverse=True)
+        return heapq.nlargest(n, names)
+
+
+_REPORT_TEMPLATE = (
+    "# {agent_name} Report - {ts}\n\n"
+    "## Summary\n{summary}\n\n"
+    "## Data\n{data}\n\n"
+    "## LLM Decision\n{llm_decision}\n\n"
+    "## Actions Taken\n{actions}\n\n"
+    "## Recommendations\n{recommendations}\n"
+)
+_REPORT_DEFAULTS = {
+    "summary": "N/A",
+    "data": "N/A",
+    "llm_decision": "N/A",
+    "actions": "N/A",
+    "recommendations": "N/A",
+}
+
+
+KNOWN_AGENTS = [
+    "data_collector",
+    "data_analyst",
+    "trade_executor",
+    "risk_manager",
+]
+
+# Report directories already created in this process
+_created_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a report directory once per process."""
+    if path in _created_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _created_dirs.add(path)
+
+
+def _ensure_reports_tree(reports_dir: Path) -> None:
+    """Create report directories for all known agents (once per reports_dir)."""
+    for agent in KNOWN_AGENTS:
+        _ensure_dir(reports_dir / agent)
 
 
 class ReportManager:
@@ -21,47 +106,51 @@ class ReportManager:
         """
         self.agent_name = agent_name
         self.reports_dir = Path(reports_dir)
-        self._ensure_dirs()
-
-    def _ensure_dirs(self) -> None:
-        """Create report directories for all known agents."""
-        known_agents = [
-            "data_collector",
-            "data_analyst",
-            "trade_executor",
-            "risk_manager",
-        ]
-        for agent in known_agents:
-            (self.reports_dir / agent).mkdir(parents=True, exist_ok=True)
+        _ensure_reports_tree(self.reports_dir)
 
-    def write_report(self, data: dict) -> str:
+    def write_report(self, data: dict, now: Optional[datetime] = None) -> str:
         """
         Write markdown report, return filepath.
 
         Args:
             data: Report data dictionary with keys: summary, data, llm_decision,
                   actions, recommendations
+            now: Report timestamp (default: current time)
 
         Returns:
             str: Path to the written report file
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        if now is None:
+            now = datetime.now()
+        timestamp = now.strftime(_FILENAME_FORMAT)
         filename = f"{timestamp}.md"
         filepath = self.reports_dir / self.agent_name / filename
 
-        # Ensure directory exists (in case new agent type)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+        # No-op after the first call (covers agent types outside KNOWN_AGENTS)
+        _ensure_dir(filepath.parent)
 
-        content = f"# {self.agent_name} Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        content += f"## Summary\n{data.get('summary', 'N/A')}\n\n"
-        content += f"## Data\n{data.get('data', 'N/A')}\n\n"
-        content += f"## LLM Decision\n{data.get('llm_decision', 'N/A')}\n\n"
-        content += f"## Actions Taken\n{data.get('actions', 'N/A')}\n\n"
-        content += f"## Recommendations\n{data.get('recommendations', 'N/A')}\n"
+        header = {
+            "agent_name": self.agent_name,
+            "ts": now.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        content = _REPORT_TEMPLATE.format_map(ChainMap(header, data, _REPORT_DEFAULTS))
 
         filepath.write_text(content, encoding="utf-8")
         return str(filepath)
 
+    async def write_report_async(self, data: dict, now: Optional[datetime] = None) -> str:
+        """
+        Write markdown report in a worker thread so disk I/O doesn't block the event loop.
+
+        Args:
+            data: Report data dictionary (see write_report)
+            now: Report timestamp (default: current time)
+
+        Returns:
+            str: Path to the written report file
+        """
+        return await asyncio.to_thread(self.write_report, data, now)
+
     def read_reports(self, agent_name: str, n: int = 3) -> list[str]:
         """
         Read last N reports from any agent.
@@ -77,15 +166,53 @@ class ReportManager:
         if not agent_dir.exists():
             return []
 
-        files = sorted(agent_dir.glob("*.md"), reverse=True)[:n]
-        return [f.read_text(encoding="utf-8") for f in files]
+        return [_read_report(agent_dir / name) for name in _report_names(agent_dir, n)]
+
+    async def read_reports_async(self, agent_name: str, n: int = 3) -> list[str]:
+        """
+        Read last N reports from any agent without blocking the event loop.
+
+        Files are read concurrently in worker threads.
+
+        Args:
+            agent_name: Name of the agent to read reports from
+            n: Number of recent reports to read (default: 3)
 
-    def list_reports(self, agent_name: str) -> list[str]:
+        Returns:
+            list[str]: List of report contents
+        """
+        agent_dir = self.reports_dir / agent_name
+        if not agent_dir.exists():
+            return []
+
+        names = _report_names(agent_dir, n)
+        return list(await asyncio.gather(
+            *[asyncio.to_thread(_read_report, agent_dir / name) for name in names]
+        ))
+
+    def read_report(self, agent_name: str, filename: str) -> str:
+        """
+        Read one report, served from memory while the file is unchanged.
+
+        Args:
+            agent_name: Name of the agent the report belongs to
+            filename: Report filename (e.g. "2025-01-01_09-00-00.md")
+
+        Returns:
+            str: Report content
+
+        Raises:
+            FileNotFoundError: If the report does not exist
+        """
+        return _read_report(self.reports_dir / agent_name / filename)
+
+    def list_reports(self, agent_name: str, n: Optional[int] = None) -> list[str]:
         """
         List report filenames for an agent.
 
         Args:
             agent_name: Name of the agent to list reports for
+            n: Only list the newest n reports (default: all)
 
         Returns:
             list[str]: Sorted list of report filenames (newest first)
@@ -94,4 +221,97 @@ class ReportManager:
         if not agent_dir.exists():
             return []
 
-        return sorted([f.name for f in agent_dir.glob("*.md")], reverse=True)
+        return _report_names(agent_dir, n)
+
+    def prune_reports(self, max_age_days: int, archive: bool = False) -> int:
+        """
+        Remove reports older than max_age_days for every agent.
+
+        Args:
+            max_age_days: Age threshold in days
+            archive: Move reports into compressed daily archives instead of deleting them
+
+        Returns:
+            int: Number of report files removed from the report directories
+        """
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).strftime(_FILENAME_FORMAT)
+        removed = 0
+        with os.scandir(self.reports_dir) as agents_it:
+            agent_dirs = [Path(e.path) for e in agents_it if e.is_dir()]
+        for agent_dir in agent_dirs:
+            with os.scandir(agent_dir) as it:
+                stale = sorted(e.name for e in it if e.name.endswith(".md") and e.name < cutoff)
+            if archive and stale:
+                _archive_reports(agent_dir, stale)
+            for name in stale:
+                try:
+                    os.remove(agent_dir / name)
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    def read_archived_reports(self, agent_name: str, date: str) -> list[tuple[str, str]]:
+        """
+        Read reports archived by prune_reports for one day.
+
+        Args:
+            agent_name: Name of the agent to read reports from
+            date: Day of the reports (YYYY-MM-DD)
+
+        Returns:
+            list[tuple[str, str]]: (filename, content) pairs in archive order
+        """
+        segment = self.reports_dir / agent_name / _ARCHIVE_DIR / f"{date}{_ARCHIVE_SUFFIX}"
+        if not segment.exists():
+            return []
+
+        with segment.open("rb") as fh:
+            reader = zstandard.ZstdDecompressor().stream_reader(fh, read_across_frames=True)
+            raw = reader.read()
+
+        reports: list[tuple[str, str]] = []
+        offset = 0
+        while offset < len(raw):
+            (name_len,) = struct.unpack_from(">I", raw, offset)
+            offset += 4
+            name = raw[offset:offset + name_len].decode("utf-8")
+            offset += name_len
+            (body_len,) = struct.unpack_from(">Q", raw, offset)
+            offset += 8
+            reports.append((name, raw[offset:offset + body_len].decode("utf-8")))
+            offset += body_len
+        return reports
+
+
+# ------------------------------------------------------------------
+# Report archives
+# ------------------------------------------------------------------
+
+# Archived reports live in <agent>/archive/<YYYY-MM-DD>.log.zst. Each report is
+# one length-prefixed record compressed as its own zstd frame, so a segment can
+# be appended to without rewriting it.
+_ARCHIVE_DIR = "archive"
+_ARCHIVE_SUFFIX = ".log.zst"
+
+
+def _archive_reports(agent_dir: Path, names: list[str]) -> None:
+    """Append the given report files to their day's compressed archive segment."""
+    archive_dir = agent_dir / _ARCHIVE_DIR
+    archive_dir.mkdir(exist_ok=True)
+    compressor = zstandard.ZstdCompressor(level=3)
+
+    by_day: dict[str, list[str]] = {}
+    for name in names:
+        by_day.setdefault(name[:10], []).append(name)
+
+    for day, day_names in by_day.items():
+        with (archive_dir / f"{day}{_ARCHIVE_SUFFIX}").open("ab") as fh:
+            for name in day_names:
+                body = (agent_dir / name).read_bytes()
+                name_bytes = name.encode("utf-8")
+                record = (
+                    struct.pack(">I", len(name_bytes)) + name_bytes
+                    + struct.pack(">Q", len(body)) + body
+                )
+                fh.write(compressor.compress(record))
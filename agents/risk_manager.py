@@ -2,11 +2,11 @@
 Risk Manager Agent - autonomous portfolio risk assessment and constraint setting.
 """
 
-import json
 import logging
 from typing import Any
 
 from agents.base import BaseAgent
+from agents.report import format_json, join_reports
 from kis.models import AccountBalance
 
 logger = logging.getLogger(__name__)
@@ -14,26 +14,21 @@ logger = logging.getLogger(__name__)
 
 def format_positions_for_risk(balance: AccountBalance, available_cash: int) -> str:
     """Render portfolio state for risk-assessment context."""
-    lines: list[str] = [
-        f"Total Evaluation: {balance.total_evlu_amt} KRW",
-        f"Total P&L: {balance.total_evlu_pfls_amt} KRW",
-        f"Available Cash: {available_cash:,} KRW",
-        "",
-        "### Holdings",
+    holdings = [
+        f"- {item.pdno} ({item.prdt_name}): "
+        f"qty={item.hldg_qty}, avg_cost={item.pchs_avg_pric}, "
+        f"cur_price={item.prpr}, pnl={item.evlu_pfls_amt} ({item.evlu_pfls_rt}%)"
+        for item in balance.items
+        if item.hldg_qty_int > 0
     ]
-
-    active_items = [item for item in balance.items if int(item.hldg_qty) > 0]
-    if not active_items:
-        lines.append("(No current positions)")
-    else:
-        for item in active_items:
-            lines.append(
-                f"- {item.pdno} ({item.prdt_name}): "
-                f"qty={item.hldg_qty}, avg_cost={item.pchs_avg_pric}, "
-                f"cur_price={item.prpr}, pnl={item.evlu_pfls_amt} ({item.evlu_pfls_rt}%)"
-            )
-
-    return "\n".join(lines)
+    return (
+        f"Total Evaluation: {balance.total_evlu_amt} KRW\n"
+        f"Total P&L: {balance.total_evlu_pfls_amt} KRW\n"
+        f"Available Cash: {available_cash:,} KRW\n"
+        "\n"
+        "### Holdings\n"
+        + ("\n".join(holdings) if holdings else "(No current positions)")
+    )
 
 
 def build_risk_context(
@@ -45,36 +40,18 @@ def build_risk_context(
     own_reports: list[str],
 ) -> str:
     """Assemble full context for the risk-assessment LLM call."""
-    parts: list[str] = []
-
-    parts.append("## Portfolio State\n")
-    parts.append(format_positions_for_risk(balance, available_cash))
-
-    parts.append("\n\n## Market Data (from Data Collector)\n")
-    if collector_reports:
-        parts.append("\n---\n".join(collector_reports))
-    else:
-        parts.append("(No market data reports available yet.)")
-
-    parts.append("\n\n## Analyst Signals\n")
-    if analyst_reports:
-        parts.append("\n---\n".join(analyst_reports))
-    else:
-        parts.append("(No analyst reports available yet.)")
-
-    parts.append("\n\n## Recent Trades\n")
-    if executor_reports:
-        parts.append("\n---\n".join(executor_reports))
-    else:
-        parts.append("(No trades executed yet.)")
-
-    parts.append("\n\n## Previous Risk Assessments\n")
-    if own_reports:
-        parts.append("\n---\n".join(own_reports))
-    else:
-        parts.append("(First risk assessment cycle.)")
-
-    return "\n".join(parts)
+    return (
+        f"## Portfolio State\n\n"
+        f"{format_positions_for_risk(balance, available_cash)}\n\n\n"
+        f"## Market Data (from Data Collector)\n\n"
+        f"{join_reports(collector_reports, '(No market data reports available yet.)')}\n\n\n"
+        f"## Analyst Signals\n\n"
+        f"{join_reports(analyst_reports, '(No analyst reports available yet.)')}\n\n\n"
+        f"## Recent Trades\n\n"
+        f"{join_reports(executor_reports, '(No trades executed yet.)')}\n\n\n"
+        f"## Previous Risk Assessments\n\n"
+        f"{join_reports(own_reports, '(First risk assessment cycle.)')}"
+    )
 
 
 class RiskManagerAgent(BaseAgent):
@@ -106,21 +83,35 @@ class RiskManagerAgent(BaseAgent):
         "}"
     )
 
+    RESPONSE_SCHEMA = {
+        "type": "object",
+        # Nothing is required: run_cycle defaults every key it reads
+        "properties": {
+            "risk_level": {"enum": ["conservative", "moderate", "aggressive"]},
+            "max_position_pct": {"type": "number"},
+            "max_single_order_value": {"type": "number"},
+            "blocked_stocks": {"type": "array", "items": {"type": "string"}},
+            "warnings": {"type": "array", "items": {"type": "string"}},
+            "portfolio_assessment": {"type": "string"},
+            "recommendations": {"type": "string"},
+        },
+    }
+
     def __init__(self, name: str, config: Any, kis_client: Any) -> None:
         super().__init__(name, config, kis_client)
+        self.llm.register_schema(self.name, self.RESPONSE_SCHEMA)
 
     async def run_cycle(self) -> dict:
         """Read all agents' reports, assess portfolio risk via LLM, broadcast warnings."""
 
         # 1. Read reports from every agent
-        collector_reports = self.read_other_reports("data_collector", 2)
-        analyst_reports = self.read_other_reports("data_analyst", 2)
-        executor_reports = self.read_other_reports("trade_executor", 3)
-        own_reports = self.read_other_reports("risk_manager", 2)
+        collector_reports = await self.read_other_reports("data_collector", 2)
+        analyst_reports = await self.read_other_reports("data_analyst", 2)
+        executor_reports = await self.read_other_reports("trade_executor", 3)
+        own_reports = await self.read_other_reports("risk_manager", 2)
 
         # 2. Fetch live portfolio state
-        balance = await self.kis.get_balance()
-        available_cash = await self.kis.get_available_cash()
+        balance, available_cash = await self.kis.get_balance_and_cash()
 
         # 3. Build risk-assessment context
         context = build_risk_context(
@@ -129,7 +120,7 @@ class RiskManagerAgent(BaseAgent):
         )
 
         # 4. LLM decides risk parameters
-        assessment = await self.llm.ask_json(self.SYSTEM_PROMPT, context)
+        assessment = await self.llm.ask_json_schema(self.SYSTEM_PROMPT, context, self.name)
 
         risk_level = assessment.get("risk_level", "N/A")
         warnings = assessment.get("warnings", [])
@@ -152,7 +143,7 @@ class RiskManagerAgent(BaseAgent):
 
         return {
             "summary": f"Risk Level: {risk_level}. Warnings: {len(warnings)}",
-            "data": json.dumps(assessment, indent=2, ensure_ascii=False),
+            "data": format_json(assessment),
             "llm_decision": portfolio_assessment,
             "actions": (
                 f"Set risk constraints: max_position={max_pos}%, "
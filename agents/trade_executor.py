@@ -2,11 +2,12 @@
 Trade Executor Agent - executes buy/sell orders autonomously based on analyst signals.
 """
 
-import json
+import asyncio
 import logging
 from typing import Any
 
 from agents.base import BaseAgent
+from agents.report import format_json, join_reports
 from kis.models import AccountBalance
 
 logger = logging.getLogger(__name__)
@@ -14,26 +15,22 @@ logger = logging.getLogger(__name__)
 
 def format_positions(balance: AccountBalance) -> str:
     """Render account holdings as a human-readable string for the LLM."""
-    if not balance.items:
+    # Skip zero-quantity ghost rows the API sometimes returns
+    holdings = [
+        f"- {item.pdno} ({item.prdt_name}): "
+        f"qty={item.hldg_qty}, avg_cost={item.pchs_avg_pric}, "
+        f"cur_price={item.prpr}, pnl={item.evlu_pfls_amt} ({item.evlu_pfls_rt}%)"
+        for item in balance.items
+        if item.hldg_qty_int != 0
+    ]
+    if not holdings:
         return "(No current positions)"
 
-    lines: list[str] = []
-    for item in balance.items:
-        # Skip zero-quantity ghost rows the API sometimes returns
-        if int(item.hldg_qty) == 0:
-            continue
-        lines.append(
-            f"- {item.pdno} ({item.prdt_name}): "
-            f"qty={item.hldg_qty}, avg_cost={item.pchs_avg_pric}, "
-            f"cur_price={item.prpr}, pnl={item.evlu_pfls_amt} ({item.evlu_pfls_rt}%)"
-        )
-
-    if not lines:
-        return "(No current positions)"
-
-    lines.insert(0, f"Total evaluation: {balance.total_evlu_amt} KRW")
-    lines.insert(1, f"Total P&L: {balance.total_evlu_pfls_amt} KRW")
-    return "\n".join(lines)
+    return "\n".join([
+        f"Total evaluation: {balance.total_evlu_amt} KRW",
+        f"Total P&L: {balance.total_evlu_pfls_amt} KRW",
+        *holdings,
+    ])
 
 
 class TradeExecutorAgent(BaseAgent):
@@ -62,20 +59,45 @@ class TradeExecutorAgent(BaseAgent):
         "If no trades should be made, return an empty orders list with reasoning."
     )
 
+    RESPONSE_SCHEMA = {
+        "type": "object",
+        "required": ["orders"],
+        "properties": {
+            "orders": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    # Only what _execute_single_order can't default; it lower()s the
+                    # action (skipping unknown ones) and int()s qty/price
+                    "required": ["stock_code", "action"],
+                    "properties": {
+                        "stock_code": {"type": "string"},
+                        "action": {"type": "string"},
+                        "qty": {"type": ["integer", "string"], "minimum": 0, "pattern": "^[0-9]+$"},
+                        "price": {"type": ["number", "string"], "minimum": 0, "pattern": "^[0-9]+$"},
+                        "order_type": {"type": "string"},
+                        "reasoning": {"type": "string"},
+                    },
+                },
+            },
+            "reasoning": {"type": "string"},
+        },
+    }
+
     def __init__(self, name: str, config: Any, kis_client: Any) -> None:
         super().__init__(name, config, kis_client)
+        self.llm.register_schema(self.name, self.RESPONSE_SCHEMA)
 
     async def run_cycle(self) -> dict:
         """Read signals, portfolio state, and risk guidance; let LLM decide trades; execute."""
 
         # 1. Gather context from other agents
-        analyst_reports = self.read_other_reports("data_analyst", 2)
-        risk_reports = self.read_other_reports("risk_manager", 1)
-        own_reports = self.read_other_reports("trade_executor", 2)
+        analyst_reports = await self.read_other_reports("data_analyst", 2)
+        risk_reports = await self.read_other_reports("risk_manager", 1)
+        own_reports = await self.read_other_reports("trade_executor", 2)
 
         # 2. Fetch live portfolio state
-        balance = await self.kis.get_balance()
-        available_cash = await self.kis.get_available_cash()
+        balance, available_cash = await self.kis.get_balance_and_cash()
 
         # 3. Build execution context
         positions_str = format_positions(balance)
@@ -84,16 +106,21 @@ class TradeExecutorAgent(BaseAgent):
         )
 
         # 4. LLM decides what to trade
-        decision = await self.llm.ask_json(self.SYSTEM_PROMPT, context)
+        decision = await self.llm.ask_json_schema(self.SYSTEM_PROMPT, context, self.name)
 
         orders = decision.get("orders", [])
         reasoning = decision.get("reasoning", "")
 
-        # 5. Execute each order
-        executed: list[dict] = []
-        for order in orders:
-            result = await self._execute_single_order(order)
-            executed.append(result)
+        # 5. Execute orders concurrently (KISClient still rate-limits the requests)
+        results = await asyncio.gather(
+            *[self._execute_single_order(order) for order in orders],
+            return_exceptions=True,
+        )
+        executed: list[dict] = [
+            {"order": order, "result": "failed", "error": str(result)}
+            if isinstance(result, Exception) else result
+            for order, result in zip(orders, results)
+        ]
 
         logger.info(
             "Executed %d/%d orders. Reasoning: %s",
@@ -104,11 +131,9 @@ class TradeExecutorAgent(BaseAgent):
 
         return {
             "summary": f"Executed {len(executed)} order(s)",
-            "data": json.dumps(executed, indent=2, ensure_ascii=False),
+            "data": format_json(executed),
             "llm_decision": reasoning,
-            "actions": json.dumps(
-                [e["order"] for e in executed], indent=2, ensure_ascii=False
-            ),
+            "actions": format_json([e["order"] for e in executed]),
             "recommendations": "See actions for trade details",
         }
 
@@ -159,27 +184,13 @@ def _build_execution_context(
     available_cash: int,
 ) -> str:
     """Assemble the full context string for the trade-decision LLM call."""
-    parts: list[str] = []
-
-    parts.append("## Analysis Signals\n")
-    if analyst_reports:
-        parts.append("\n---\n".join(analyst_reports))
-    else:
-        parts.append("(No analyst reports available yet.)")
-
-    parts.append(f"\n\n## Current Positions\n{positions_str}")
-    parts.append(f"\nAvailable Cash: {available_cash:,} KRW")
-
-    parts.append("\n\n## Risk Constraints\n")
-    if risk_reports:
-        parts.append("\n---\n".join(risk_reports))
-    else:
-        parts.append("(No risk constraints issued yet - use your own judgment.)")
-
-    parts.append("\n\n## Recent Trade History\n")
-    if own_reports:
-        parts.append("\n---\n".join(own_reports))
-    else:
-        parts.append("(No previous trades.)")
-
-    return "\n".join(parts)
+    return (
+        f"## Analysis Signals\n\n"
+        f"{join_reports(analyst_reports, '(No analyst reports available yet.)')}\n\n\n"
+        f"## Current Positions\n{positions_str}\n\n"
+        f"Available Cash: {available_cash:,} KRW\n\n\n"
+        f"## Risk Constraints\n\n"
+        f"{join_reports(risk_reports, '(No risk constraints issued yet - use your own judgment.)')}\n\n\n"
+        f"## Recent Trade History\n\n"
+        f"{join_reports(own_reports, '(No previous trades.)')}"
+    )
@@ -1,17 +1,16 @@
 """
 Central configuration module for Agent Trading Company.
-Loads environment variables and exposes a Config dataclass with validated settings.
+Loads environment variables (on first get_config() call) and exposes a Config dataclass
+with validated settings.
 """
 
 import os
-import json
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import repeat
 from typing import List
 from pathlib import Path
-from dotenv import load_dotenv
-
-# Load .env file
-load_dotenv()
+import orjson
 
 WATCHLIST_FILE = Path(__file__).parent / "watchlist.json"
 
@@ -30,10 +29,14 @@ class Config:
     kis_acnt_prdt_cd: str = "01"
     kis_base_url: str = field(init=False)
     kis_ws_url: str = field(init=False)
+    # The order hashkey header is optional for KIS; fetching it costs an extra request per order
+    kis_use_hashkey: bool = field(default_factory=lambda: os.getenv("KIS_USE_HASHKEY", "false").lower() == "true")
 
     # OpenAI credentials
     openai_api_key: str = field(default_factory=lambda: os.getenv("OPENAI_API_KEY", ""))
     openai_model: str = field(init=False)
+    # Seconds an identical LLM prompt reuses the previous response (0 disables the cache)
+    llm_cache_ttl: int = field(default_factory=lambda: int(os.getenv("LLM_CACHE_TTL", "300")))
 
     # Agent configuration
     watchlist: List[str] = field(default_factory=lambda: _parse_watchlist())
@@ -42,6 +45,17 @@ class Config:
     trade_executor_interval: int = field(default_factory=lambda: int(os.getenv("TRADE_EXECUTOR_INTERVAL", "180")))
     risk_manager_interval: int = field(default_factory=lambda: int(os.getenv("RISK_MANAGER_INTERVAL", "90")))
 
+    # Reports older than this many days are removed (0 keeps all reports);
+    # with REPORT_ARCHIVE enabled they are moved into compressed daily archives instead
+    report_retention_days: int = field(default_factory=lambda: int(os.getenv("REPORT_RETENTION_DAYS", "0")))
+    report_archive: bool = field(default_factory=lambda: os.getenv("REPORT_ARCHIVE", "false").lower() == "true")
+
+    # Maximum agent cycles running at once (shared across all agents)
+    max_concurrent_cycles: int = field(default_factory=lambda: int(os.getenv("MAX_CONCURRENT_CYCLES", "4")))
+
+    # KIS request concurrency (per-agent fan-out; the client still enforces its own rate limit)
+    max_concurrent_kis: int = field(default_factory=lambda: int(os.getenv("MAX_CONCURRENT_KIS", "8")))
+
     # API server configuration
     api_port: int = field(default_factory=lambda: int(os.getenv("API_PORT", "8000")))
     log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
@@ -107,6 +121,14 @@ class Config:
             errors.append("trade_executor_interval must be positive")
         if self.risk_manager_interval <= 0:
             errors.append("risk_manager_interval must be positive")
+        if self.max_concurrent_cycles <= 0:
+            errors.append("max_concurrent_cycles must be positive")
+        if self.max_concurrent_kis <= 0:
+            errors.append("max_concurrent_kis must be positive")
+        if self.report_retention_days < 0:
+            errors.append("report_retention_days must not be negative")
+        if self.llm_cache_ttl < 0:
+            errors.append("llm_cache_ttl must not be negative")
 
         if errors:
             raise ValueError("Configuration validation failed:\n" + "\n".join(f"  - {e}" for e in errors))
@@ -116,20 +138,38 @@ def _load_watchlist_file() -> List[str] | None:
     """Load watchlist from JSON file. Returns None if file doesn't exist."""
     if WATCHLIST_FILE.exists():
         try:
-            data = json.loads(WATCHLIST_FILE.read_text(encoding="utf-8"))
-            if isinstance(data, list) and all(isinstance(s, str) for s in data):
+            data = orjson.loads(WATCHLIST_FILE.read_bytes())
+            if isinstance(data, list) and all(map(isinstance, data, repeat(str))):
                 return data
-        except (json.JSONDecodeError, OSError):
+        except (orjson.JSONDecodeError, OSError):
             pass
     return None
 
 
+# Last watchlist loaded or saved in this process (the file is the source of truth,
+# and only this module writes it)
+_watchlist_cache: List[str] | None = None
+
+
 def _save_watchlist_file(watchlist: List[str]) -> None:
-    """Persist watchlist to JSON file."""
-    WATCHLIST_FILE.write_text(json.dumps(watchlist, indent=2, ensure_ascii=False), encoding="utf-8")
+    """Persist watchlist to JSON file (skipped when it already holds this list)."""
+    global _watchlist_cache
+    if watchlist == _watchlist_cache and WATCHLIST_FILE.exists():
+        return
+    WATCHLIST_FILE.write_bytes(orjson.dumps(watchlist, option=orjson.OPT_INDENT_2))
+    _watchlist_cache = list(watchlist)
 
 
 def _parse_watchlist() -> List[str]:
+    """Return a copy of the watchlist, loading it on first use."""
+    global _watchlist_cache
+    if _watchlist_cache is None:
+        _watchlist_cache = _read_watchlist()
+    # Hand out a copy so no Config ever shares the cached list
+    return list(_watchlist_cache)
+
+
+def _read_watchlist() -> List[str]:
     """Load watchlist with priority: file > env var > defaults."""
     # 1. Try file first
     from_file = _load_watchlist_file()
@@ -149,5 +189,21 @@ def _parse_watchlist() -> List[str]:
     return watchlist
 
 
-# Global config instance
-config = Config()
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Load the .env file and build the process-wide Config (once, on first use).
+
+    This is the only place the environment is read: the field factories run
+    once here, and later calls return the same instance.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return Config()
+
+
+def __getattr__(name: str):
+    """Keep ``from config import config`` working without building Config at import time."""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -19,7 +19,7 @@ export function useAgentData() {
   const [marketStatus, setMarketStatus] = useState<MarketStatus | null>(null);
   const [loading, setLoading] = useState(true);
 
-  const { lastEvent, lastTick, isConnected } = useWebSocket();
+  const { lastEvent, lastTicks, isConnected } = useWebSocket();
   const prevConnectedRef = useRef(false);
 
   const fetchAll = useCallback(async () => {
@@ -109,40 +109,45 @@ export function useAgentData() {
 
   // Handle high-frequency price ticks on a separate channel
   useEffect(() => {
-    if (!lastTick) return;
-    const tick = lastTick;
-    const tickPrice = Number(tick.price) || 0;
+    if (!lastTicks || lastTicks.length === 0) return;
+    const ticks = lastTicks;
 
     // Update watchlist quotes
     setQuotes((prev) => {
-      const idx = prev.findIndex((q) => q.stock_code === tick.stock_code);
-      const updated: StockQuote = {
-        stock_code: tick.stock_code ?? "",
-        price: tick.price ?? "0",
-        open: tick.open ?? "0",
-        high: tick.high ?? "0",
-        low: tick.low ?? "0",
-        volume: tick.volume ?? "0",
-        change_rate: tick.change_rate ?? "0",
-        change_amount: tick.change_amount ?? "0",
-        change_sign: tick.change_sign ?? "3",
-      };
-      if (idx >= 0) {
-        const next = [...prev];
-        next[idx] = updated;
-        return next;
+      const next = [...prev];
+      for (const tick of ticks) {
+        const idx = next.findIndex((q) => q.stock_code === tick.stock_code);
+        const updated: StockQuote = {
+          stock_code: tick.stock_code ?? "",
+          price: tick.price ?? "0",
+          open: tick.open ?? "0",
+          high: tick.high ?? "0",
+          low: tick.low ?? "0",
+          volume: tick.volume ?? "0",
+          change_rate: tick.change_rate ?? "0",
+          change_amount: tick.change_amount ?? "0",
+          change_sign: tick.change_sign ?? "3",
+        };
+        if (idx >= 0) {
+          next[idx] = updated;
+        } else {
+          next.push(updated);
+        }
       }
-      return [...prev, updated];
+      return next;
     });
 
-    // Update holdings if this stock is held
-    if (tickPrice > 0) {
-      setBalance((prev) => {
-        if (!prev) return prev;
+    // Update holdings for any ticked stock that is held
+    setBalance((prev) => {
+      if (!prev) return prev;
+      let items: typeof prev.items | null = null;
+      for (const tick of ticks) {
+        const tickPrice = Number(tick.price) || 0;
+        if (tickPrice <= 0) continue;
         const idx = prev.items.findIndex((item) => item.pdno === tick.stock_code);
-        if (idx < 0) return prev;
+        if (idx < 0) continue;
 
-        const items = [...prev.items];
+        if (!items) items = [...prev.items];
         const item = { ...items[idx] };
         item.prpr = tickPrice;
         item.evlu_pfls_amt = (tickPrice - item.pchs_avg_pric) * item.hldg_qty;
@@ -151,14 +156,15 @@ export function useAgentData() {
             ? ((tickPrice - item.pchs_avg_pric) / item.pchs_avg_pric) * 100
             : 0;
         items[idx] = item;
+      }
+      if (!items) return prev;
 
-        const total_evlu_amt = items.reduce((sum, i) => sum + i.prpr * i.hldg_qty, 0);
-        const total_evlu_pfls_amt = items.reduce((sum, i) => sum + i.evlu_pfls_amt, 0);
+      const total_evlu_amt = items.reduce((sum, i) => sum + i.prpr * i.hldg_qty, 0);
+      const total_evlu_pfls_amt = items.reduce((sum, i) => sum + i.evlu_pfls_amt, 0);
 
-        return { items, total_evlu_amt, total_evlu_pfls_amt };
-      });
-    }
-  }, [lastTick]);
+      return { items, total_evlu_amt, total_evlu_pfls_amt };
+    });
+  }, [lastTicks]);
 
   return {
     agents,
@@ -7,9 +7,9 @@ function getWsUrl(): string {
 }
 
 export function useWebSocket() {
-  // Separate channels: lastEvent for infrequent events, lastTick for high-frequency price updates
+  // Separate channels: lastEvent for infrequent events, lastTicks for high-frequency price updates
   const [lastEvent, setLastEvent] = useState<WSEvent | null>(null);
-  const [lastTick, setLastTick] = useState<Record<string, string> | null>(null);
+  const [lastTicks, setLastTicks] = useState<Record<string, string>[] | null>(null);
   const [isConnected, setIsConnected] = useState(false);
   const wsRef = useRef<WebSocket | null>(null);
   const retryCountRef = useRef(0);
@@ -30,9 +30,10 @@ export function useWebSocket() {
       ws.onmessage = (event) => {
         try {
           const parsed = JSON.parse(event.data) as WSEvent;
-          if (parsed.type === "price_update") {
-            // Price ticks go to a separate channel so they don't swamp other events
-            setLastTick(parsed.data as Record<string, string>);
+          if (parsed.type === "price_updates") {
+            // Price ticks (batched by the server, latest per stock) go to a
+            // separate channel so they don't swamp other events
+            setLastTicks(parsed.data as unknown as Record<string, string>[]);
           } else {
             setLastEvent(parsed);
           }
@@ -67,5 +68,5 @@ export function useWebSocket() {
     };
   }, [connect]);
 
-  return { lastEvent, lastTick, isConnected };
+  return { lastEvent, lastTicks, isConnected };
 }
@@ -68,6 +68,6 @@ export interface WSEvent {
     | "new_report"
     | "trade_executed"
     | "risk_alert"
-    | "price_update";
+    | "price_updates";
   data: Record<string, unknown>;
 }
@@ -8,12 +8,20 @@ until expiry so that callers never need to manage authentication manually.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
+import json
 import logging
+import os
+import random
 import time
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, ClassVar
 
 import httpx
+import orjson
+from pydantic import TypeAdapter
 
 from kis.endpoints import ENDPOINTS, get_tr_id
 from kis.models import (
@@ -31,6 +39,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Access tokens are persisted here so restarts don't spend KIS's token-issuance quota
+TOKEN_CACHE_DIR = Path.home() / ".cache" / "agent_trading"
+
+# List validators: one pydantic-core call per response instead of one per item
+_DAILY_PRICES = TypeAdapter(list[DailyPrice])
+_BALANCE_ITEMS = TypeAdapter(list[BalanceItem])
+
 
 class KISClient:
     """Async client wrapping KIS Open API endpoints.
@@ -40,24 +55,83 @@ class KISClient:
                 and trading-mode settings.
     """
 
-    # KIS API rate limit: minimum seconds between requests
-    # Paper trading server is stricter — 0.25s avoids 500 errors
-    _REQUEST_INTERVAL = 0.25
+    # KIS API rate limit (token bucket): sustained requests per second, and
+    # how many requests may burst back-to-back. Paper trading server is
+    # stricter — bursts cause 500 errors, so it keeps the old 0.25s spacing.
+    _RATE_PER_SEC = 4.0
+    _BURST_CAPACITY = {"live": 5.0, "paper": 1.0}
     # Retry settings for transient server errors (5xx)
     _MAX_RETRIES = 3
     _RETRY_BACKOFF = 0.5  # seconds; doubles each retry
+    # Wall-clock budget (seconds) for one logical request, retries included
+    _REQUEST_BUDGET = 8.0
+    # Background token renewal: seconds before expiry, and retry delay on failure
+    _TOKEN_REFRESH_MARGIN = 120
+    _TOKEN_REFRESH_RETRY = 60
+    # Maximum stock codes per multi-stock quote request
+    _MULTI_PRICE_MAX = 30
+    # Seconds a balance response is reused (invalidated whenever an order is placed)
+    _BALANCE_TTL = 2.0
+
+    # Static query parameters (per-request fields are merged in by each method)
+    _BALANCE_PARAMS_TEMPLATE: ClassVar[dict[str, str]] = {
+        "AFHR_FLPR_YN": "N",
+        "OFL_YN": "",
+        "INQR_DVSN": "01",
+        "UNPR_DVSN": "01",
+        "FUND_STTL_ICLD_YN": "N",
+        "FNCG_AMT_AUTO_RDPT_YN": "N",
+        "PRCS_DVSN": "01",
+        "CTX_AREA_FK100": "",
+        "CTX_AREA_NK100": "",
+    }
+    _PRICE_PARAMS_TEMPLATE: ClassVar[dict[str, str]] = {
+        "fid_cond_mrkt_div_code": "J",
+    }
+    _DAILY_PRICE_PARAMS_TEMPLATE: ClassVar[dict[str, str]] = {
+        "fid_cond_mrkt_div_code": "J",
+        "fid_input_date_1": "",
+        "fid_input_date_2": "",
+        "fid_org_adj_prc": "0",
+    }
 
     def __init__(self, config: Config) -> None:
         self.config = config
+        # HTTP/2 (negotiated via ALPN, falls back to HTTP/1.1) lets concurrent
+        # agent requests share one keep-alive TLS connection
         self.client = httpx.AsyncClient(
             base_url=config.kis_base_url,
-            timeout=30.0,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=8,
+                max_connections=16,
+                keepalive_expiry=300,
+            ),
         )
+        # Static request parts, built once
+        self._base_headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "appkey": config.kis_app_key,
+            "appsecret": config.kis_app_secret,
+            "custtype": "P",
+        }
+        self._account_stub = {
+            "CANO": config.kis_account_no,
+            "ACNT_PRDT_CD": config.kis_acnt_prdt_cd,
+        }
+        self._balance_params = {**self._account_stub, **self._BALANCE_PARAMS_TEMPLATE}
         self._token: str | None = None
         self._token_expires: datetime | None = None
         self._token_lock = asyncio.Lock()
-        self._rate_lock = asyncio.Lock()
-        self._last_request_time: float = 0.0
+        self._refresher_task: asyncio.Task[None] | None = None
+        self._bucket_capacity = self._BURST_CAPACITY.get(config.trading_mode, 1.0)
+        self._tokens: float = self._bucket_capacity
+        self._last_refill: float = time.monotonic()
+        self._token_cache_file = TOKEN_CACHE_DIR / f"kis_token_{config.trading_mode}.json"
+        # Short-lived read cache: key -> (fetched_at, in-flight or finished fetch)
+        self._response_cache: dict[str, tuple[float, asyncio.Future[Any]]] = {}
+        self._load_cached_token()
 
     # ------------------------------------------------------------------
     # Authentication
@@ -67,36 +141,97 @@ class KISClient:
         """Obtain (or return cached) OAuth2 access token.
 
         Uses an asyncio.Lock to prevent concurrent token requests when
-        multiple agents start simultaneously.
+        multiple agents start simultaneously. The first successful call also
+        starts a background task that renews the token shortly before it
+        expires, so requests never pay for the refresh themselves.
 
         Returns:
             Bearer access-token string.
         """
         if self._token and self._token_expires and datetime.now() < self._token_expires:
+            self._start_refresher()
             return self._token
 
         async with self._token_lock:
             # Double-check after acquiring lock (another coroutine may have refreshed)
-            if self._token and self._token_expires and datetime.now() < self._token_expires:
-                return self._token
-
-            body = {
-                "grant_type": "client_credentials",
-                "appkey": self.config.kis_app_key,
-                "appsecret": self.config.kis_app_secret,
-            }
-
-            resp = await self.client.post(ENDPOINTS["token"], json=body)
-            resp.raise_for_status()
-            token_data = TokenResponse(**resp.json())
-
-            self._token = token_data.access_token
-            self._token_expires = datetime.now() + timedelta(
-                seconds=token_data.expires_in - 60
-            )
+            if not (self._token and self._token_expires and datetime.now() < self._token_expires):
+                await self._fetch_token()
+        self._start_refresher()
+        return self._token
 
-            logger.info("KIS access token acquired (expires in %ds)", token_data.expires_in)
-            return self._token
+    async def _fetch_token(self) -> None:
+        """Request a new access token from KIS. Caller must hold ``_token_lock``."""
+        body = {
+            "grant_type": "client_credentials",
+            "appkey": self.config.kis_app_key,
+            "appsecret": self.config.kis_app_secret,
+        }
+
+        resp = await self.client.post(
+            ENDPOINTS["token"],
+            content=orjson.dumps(body),
+            headers={"Content-Type": self._base_headers["Content-Type"]},
+        )
+        resp.raise_for_status()
+        token_data = TokenResponse.model_validate_json(resp.content)
+
+        self._token = token_data.access_token
+        self._token_expires = datetime.now() + timedelta(
+            seconds=token_data.expires_in - 60
+        )
+
+        logger.info("KIS access token acquired (expires in %ds)", token_data.expires_in)
+        self._save_cached_token()
+
+    def _start_refresher(self) -> None:
+        """Start the background token refresher unless it is already running."""
+        if self._refresher_task is None or self._refresher_task.done():
+            self._refresher_task = asyncio.create_task(self._refresher_loop())
+
+    async def _refresher_loop(self) -> None:
+        """Renew the access token ``_TOKEN_REFRESH_MARGIN`` seconds before expiry."""
+        while True:
+            delay = (self._token_expires - datetime.now()).total_seconds() - self._TOKEN_REFRESH_MARGIN
+            await asyncio.sleep(max(delay, 0.0))
+            try:
+                async with self._token_lock:
+                    await self._fetch_token()
+            except (httpx.HTTPError, ValueError) as e:
+                logger.warning("Background KIS token refresh failed: %s", e)
+                await asyncio.sleep(self._TOKEN_REFRESH_RETRY)
+
+    def _app_key_digest(self) -> str:
+        """Fingerprint of the app key, so a cached token is never used with other credentials."""
+        return hashlib.sha256(self.config.kis_app_key.encode("utf-8")).hexdigest()
+
+    def _load_cached_token(self) -> None:
+        """Load a still-valid token persisted by a previous process, if any."""
+        try:
+            data = json.loads(self._token_cache_file.read_text(encoding="utf-8"))
+            expires = datetime.fromisoformat(data["expires"])
+            if data.get("app_key_sha256") != self._app_key_digest() or expires <= datetime.now():
+                return
+            self._token = data["access_token"]
+            self._token_expires = expires
+            logger.info("Loaded cached KIS access token (valid until %s)", expires.isoformat())
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def _save_cached_token(self) -> None:
+        """Persist the current token atomically with owner-only permissions."""
+        try:
+            TOKEN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = self._token_cache_file.with_suffix(".tmp")
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({
+                    "access_token": self._token,
+                    "expires": self._token_expires.isoformat(),
+                    "app_key_sha256": self._app_key_digest(),
+                }, fh)
+            os.replace(tmp, self._token_cache_file)
+        except OSError as e:
+            logger.warning("Could not persist KIS access token: %s", e)
 
     async def _ensure_token(self) -> None:
         """Ensure a valid token is cached, refreshing if necessary."""
@@ -107,40 +242,71 @@ class KISClient:
     # ------------------------------------------------------------------
 
     async def _throttle(self) -> None:
-        """Ensure minimum interval between API requests."""
-        async with self._rate_lock:
+        """Wait for a rate-limit token (token bucket shared by all callers).
+
+        The bucket update contains no await, so it runs atomically on the
+        event loop; waiters sleep without holding anything and re-check.
+        """
+        while True:
             now = time.monotonic()
-            elapsed = now - self._last_request_time
-            if elapsed < self._REQUEST_INTERVAL:
-                await asyncio.sleep(self._REQUEST_INTERVAL - elapsed)
-            self._last_request_time = time.monotonic()
+            self._tokens = min(
+                self._bucket_capacity,
+                self._tokens + (now - self._last_refill) * self._RATE_PER_SEC,
+            )
+            self._last_refill = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - self._tokens) / self._RATE_PER_SEC)
 
     async def _request_with_retry(
         self,
         method: str,
         url: str,
+        idempotent: bool = True,
+        deadline: float | None = None,
         **kwargs: object,
     ) -> httpx.Response:
-        """Execute an HTTP request with rate-limiting and retry on 5xx errors."""
-        last_exc: Exception | None = None
-        for attempt in range(self._MAX_RETRIES):
+        """Execute an HTTP request with rate-limiting and retry on 5xx errors.
+
+        Non-idempotent requests (order placement) are sent once: a 5xx does
+        not prove the order was rejected, so retrying could place it twice.
+        Retries wait a randomized ("full jitter") exponential backoff so
+        concurrent callers don't retry in lockstep.
+
+        Backoff is capped by *deadline* (a ``time.monotonic()`` value,
+        default ``_REQUEST_BUDGET`` from now); once it passes, the last
+        server error is raised instead of retrying again.
+        """
+        if deadline is None:
+            deadline = time.monotonic() + self._REQUEST_BUDGET
+        attempts = self._MAX_RETRIES if idempotent else 1
+        for attempt in range(attempts):
             await self._throttle()
             resp = await self.client.request(method, url, **kwargs)
             if resp.status_code < 500:
                 return resp
-            last_exc = httpx.HTTPStatusError(
-                f"Server error '{resp.status_code}'",
-                request=resp.request,
-                response=resp,
-            )
-            wait = self._RETRY_BACKOFF * (2 ** attempt)
+            if attempt + 1 == attempts:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    "KIS API %s %s returned %d, request budget exhausted",
+                    method, url, resp.status_code,
+                )
+                break
+            wait = min(random.uniform(0, self._RETRY_BACKOFF * (2 ** attempt)), remaining)
             logger.warning(
                 "KIS API %s %s returned %d, retrying in %.1fs (attempt %d/%d)",
-                method, url, resp.status_code, wait, attempt + 1, self._MAX_RETRIES,
+                method, url, resp.status_code, wait, attempt + 1, attempts,
             )
             await asyncio.sleep(wait)
-        # All retries exhausted — raise the last error
-        raise last_exc  # type: ignore[misc]
+        # All attempts exhausted — raise the server error
+        raise httpx.HTTPStatusError(
+            f"Server error '{resp.status_code}'",
+            request=resp.request,
+            response=resp,
+        )
 
     # ------------------------------------------------------------------
     # Headers & hashkey
@@ -158,34 +324,35 @@ class KISClient:
         """
         await self._ensure_token()
         return {
-            "Content-Type": "application/json; charset=utf-8",
+            **self._base_headers,
             "authorization": f"Bearer {self._token}",
-            "appkey": self.config.kis_app_key,
-            "appsecret": self.config.kis_app_secret,
             "tr_id": tr_id,
-            "custtype": "P",
         }
 
-    async def _get_hashkey(self, data: dict) -> str:
+    async def _get_hashkey(self, body: bytes, deadline: float | None = None) -> str:
         """Generate a hashkey for order request bodies.
 
-        The KIS API requires a ``hashkey`` header on POST trading requests.
-        This method calls the ``/uapi/hashkey`` endpoint to compute it.
+        The KIS API accepts an optional ``hashkey`` header on POST trading
+        requests. This method calls the ``/uapi/hashkey`` endpoint to compute it.
 
         Args:
-            data: The JSON body that will be sent in the trading request.
+            body: The exact JSON bytes that will be sent in the trading request.
+            deadline: Optional ``time.monotonic()`` retry deadline shared with
+                the trading request.
 
         Returns:
             hashkey string.
         """
         headers = {
-            "Content-Type": "application/json; charset=utf-8",
-            "appkey": self.config.kis_app_key,
-            "appsecret": self.config.kis_app_secret,
+            "Content-Type": self._base_headers["Content-Type"],
+            "appkey": self._base_headers["appkey"],
+            "appsecret": self._base_headers["appsecret"],
         }
-        resp = await self._request_with_retry("POST", ENDPOINTS["hashkey"], json=data, headers=headers)
+        resp = await self._request_with_retry(
+            "POST", ENDPOINTS["hashkey"], deadline=deadline, content=body, headers=headers
+        )
         resp.raise_for_status()
-        return resp.json()["HASH"]
+        return orjson.loads(resp.content)["HASH"]
 
     # ------------------------------------------------------------------
     # Market data
@@ -202,21 +369,102 @@ class KISClient:
         """
         tr_id = get_tr_id("price", self.config.trading_mode)
         headers = await self._get_headers(tr_id)
-        params = {
-            "fid_cond_mrkt_div_code": "J",
-            "fid_input_iscd": stock_code,
-        }
+        params = {**self._PRICE_PARAMS_TEMPLATE, "fid_input_iscd": stock_code}
 
         resp = await self._request_with_retry("GET", ENDPOINTS["price"], headers=headers, params=params)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         if data.get("rt_cd") != "0":
             raise RuntimeError(
                 f"KIS price API error: [{data.get('msg_cd')}] {data.get('msg1')}"
             )
 
-        return StockPrice(**data["output"])
+        return StockPrice.from_kis(data["output"])
+
+    async def get_prices_batch(self, stock_codes: list[str]) -> dict[str, StockPrice]:
+        """Fetch current quotes for many stocks with as few requests as possible.
+
+        In live mode this uses the multi-stock quote endpoint, which accepts up
+        to ``_MULTI_PRICE_MAX`` codes per call; codes it fails to return are
+        then fetched individually. The paper server does not offer that
+        endpoint, so quotes are fetched individually (concurrently) there.
+        Every code therefore gets one individual attempt at most, and codes
+        absent from the result have already failed it - callers should not
+        retry them with :meth:`get_price`.
+
+        Args:
+            stock_codes: 6-digit KRX stock codes.
+
+        Returns:
+            Mapping of stock code to parsed :class:`StockPrice`.
+        """
+        if self.config.trading_mode != "live":
+            return await self._get_prices_individually(stock_codes)
+
+        prices: dict[str, StockPrice] = {}
+        for start in range(0, len(stock_codes), self._MULTI_PRICE_MAX):
+            chunk = stock_codes[start:start + self._MULTI_PRICE_MAX]
+            try:
+                prices.update(await self._get_multi_price(chunk))
+            except Exception as e:
+                logger.warning("Multi-price request failed for %d code(s): %s", len(chunk), e)
+        missing = [code for code in stock_codes if code not in prices]
+        if missing:
+            prices.update(await self._get_prices_individually(missing))
+        return prices
+
+    async def _get_prices_individually(self, stock_codes: list[str]) -> dict[str, StockPrice]:
+        """Concurrent single-stock quotes; codes that fail are logged and left out."""
+        results = await asyncio.gather(
+            *[self.get_price(code) for code in stock_codes],
+            return_exceptions=True,
+        )
+        prices: dict[str, StockPrice] = {}
+        for code, result in zip(stock_codes, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to get price for %s: %s", code, result)
+            else:
+                prices[code] = result
+        return prices
+
+    async def _get_multi_price(self, stock_codes: list[str]) -> dict[str, StockPrice]:
+        """Single multi-stock quote request (at most ``_MULTI_PRICE_MAX`` codes)."""
+        tr_id = get_tr_id("multi_price", self.config.trading_mode)
+        headers = await self._get_headers(tr_id)
+        params: dict[str, str] = {}
+        for i, code in enumerate(stock_codes, start=1):
+            params[f"FID_COND_MRKT_DIV_CODE_{i}"] = "J"
+            params[f"FID_INPUT_ISCD_{i}"] = code
+
+        resp = await self._request_with_retry(
+            "GET", ENDPOINTS["multi_price"], headers=headers, params=params
+        )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+
+        if data.get("rt_cd") != "0":
+            raise RuntimeError(
+                f"KIS multi-price API error: [{data.get('msg_cd')}] {data.get('msg1')}"
+            )
+
+        prices: dict[str, StockPrice] = {}
+        for item in data.get("output", []):
+            code = item.get("inter_shrn_iscd", "")
+            if code:
+                prices[code] = StockPrice.model_construct(
+                    stck_prpr=item.get("inter2_prpr", ""),
+                    stck_oprc=item.get("inter2_oprc", ""),
+                    stck_hgpr=item.get("inter2_hgpr", ""),
+                    stck_lwpr=item.get("inter2_lwpr", ""),
+                    acml_vol=item.get("acml_vol", ""),
+                    prdy_ctrt=item.get("prdy_ctrt", ""),
+                    prdy_vrss=item.get("inter2_prdy_vrss", ""),
+                    prdy_vrss_sign=item.get("prdy_vrss_sign", ""),
+                    stck_mxpr=item.get("inter2_mxpr", ""),
+                    stck_llam=item.get("inter2_llam", ""),
+                )
+        return prices
 
     async def get_daily_prices(
         self,
@@ -237,19 +485,16 @@ class KISClient:
         tr_id = get_tr_id("daily_price", self.config.trading_mode)
         headers = await self._get_headers(tr_id)
         params = {
-            "fid_cond_mrkt_div_code": "J",
+            **self._DAILY_PRICE_PARAMS_TEMPLATE,
             "fid_input_iscd": stock_code,
-            "fid_input_date_1": "",
-            "fid_input_date_2": "",
             "fid_period_div_code": period,
-            "fid_org_adj_prc": "0",
         }
 
         resp = await self._request_with_retry(
             "GET", ENDPOINTS["daily_price"], headers=headers, params=params
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         if data.get("rt_cd") != "0":
             raise RuntimeError(
@@ -257,7 +502,7 @@ class KISClient:
             )
 
         items = data.get("output2", [])
-        return [DailyPrice(**item) for item in items[:count]]
+        return _DAILY_PRICES.validate_python(items[:count])
 
     # ------------------------------------------------------------------
     # Trading
@@ -273,6 +518,11 @@ class KISClient:
     ) -> OrderResponse:
         """Internal helper to place a buy or sell order.
 
+        KIS accepts orders only through REST (``order-cash``); its WebSocket
+        API carries real-time quotes and execution notices, not order
+        submission. Latency is kept down by reusing the pooled keep-alive
+        connection and skipping the optional hashkey request.
+
         Args:
             side: ``"buy"`` or ``"sell"``.
             stock_code: 6-digit KRX stock code.
@@ -285,23 +535,40 @@ class KISClient:
         """
         tr_id = get_tr_id(side, self.config.trading_mode)
         body = {
-            "CANO": self.config.kis_account_no,
-            "ACNT_PRDT_CD": self.config.kis_acnt_prdt_cd,
+            **self._account_stub,
             "PDNO": stock_code,
             "ORD_DVSN": order_type,
             "ORD_QTY": str(qty),
             "ORD_UNPR": str(price),
         }
 
-        hashkey = await self._get_hashkey(body)
-        headers = await self._get_headers(tr_id)
-        headers["hashkey"] = hashkey
-
-        resp = await self._request_with_retry("POST", ENDPOINTS["order"], json=body, headers=headers)
+        # Serialize once so the hashkey (if used) covers exactly the bytes sent
+        payload = orjson.dumps(body)
+        # One retry budget covers the hashkey and order requests together
+        deadline = time.monotonic() + self._REQUEST_BUDGET
+        if self.config.kis_use_hashkey:
+            # The hashkey call needs no token, so overlap it with header/token setup
+            headers, hashkey = await asyncio.gather(
+                self._get_headers(tr_id), self._get_hashkey(payload, deadline)
+            )
+            headers["hashkey"] = hashkey
+        else:
+            headers = await self._get_headers(tr_id)
+
+        # Holdings/cash change with any order attempt; drop the cached balance before
+        # and after, so a balance fetched while the order was in flight isn't kept
+        self._response_cache.pop("balance", None)
+        try:
+            resp = await self._request_with_retry(
+                "POST", ENDPOINTS["order"],
+                idempotent=False, deadline=deadline, content=payload, headers=headers,
+            )
+        finally:
+            self._response_cache.pop("balance", None)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
-        output = OrderOutput(**data["output"]) if data.get("output") else None
+        output = OrderOutput.model_validate(data["output"]) if data.get("output") else None
         return OrderResponse(
             rt_cd=data.get("rt_cd", ""),
             msg_cd=data.get("msg_cd", ""),
@@ -360,51 +627,89 @@ class KISClient:
     # Account
     # ------------------------------------------------------------------
 
-    async def get_balance(self) -> AccountBalance:
-        """Fetch current account balance and holdings.
+    async def _cached(
+        self, key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a recent result for key, or run fetch and remember it for ttl seconds.
+
+        Concurrent callers share one in-flight fetch; failures are not cached.
+        """
+        entry = self._response_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return await asyncio.shield(entry[1])
+
+        future = asyncio.ensure_future(fetch())
+        self._response_cache[key] = (time.monotonic(), future)
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            if self._response_cache.get(key, (0.0, None))[1] is future:
+                del self._response_cache[key]
+            raise
+
+    async def _inquire_balance(self, label: str) -> dict:
+        """Return the raw ``inquire-balance`` body, reusing one fetched within ``_BALANCE_TTL``.
+
+        Args:
+            label: Operation name used in the error message.
 
         Returns:
-            Parsed :class:`AccountBalance` containing individual
-            :class:`BalanceItem` entries and totals.
+            Parsed JSON response.
+        """
+        return await self._cached(
+            "balance", self._BALANCE_TTL, lambda: self._fetch_balance(label)
+        )
+
+    async def _fetch_balance(self, label: str) -> dict:
+        """Call ``inquire-balance`` and return the raw response body.
+
+        Args:
+            label: Operation name used in the error message.
+
+        Returns:
+            Parsed JSON response.
         """
         tr_id = get_tr_id("balance", self.config.trading_mode)
         headers = await self._get_headers(tr_id)
-        params = {
-            "CANO": self.config.kis_account_no,
-            "ACNT_PRDT_CD": self.config.kis_acnt_prdt_cd,
-            "AFHR_FLPR_YN": "N",
-            "OFL_YN": "",
-            "INQR_DVSN": "01",
-            "UNPR_DVSN": "01",
-            "FUND_STTL_ICLD_YN": "N",
-            "FNCG_AMT_AUTO_RDPT_YN": "N",
-            "PRCS_DVSN": "01",
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": "",
-        }
 
         resp = await self._request_with_retry(
-            "GET", ENDPOINTS["balance"], headers=headers, params=params
+            "GET", ENDPOINTS["balance"], headers=headers, params=self._balance_params
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         if data.get("rt_cd") != "0":
             raise RuntimeError(
-                f"KIS balance API error: [{data.get('msg_cd')}] {data.get('msg1')}"
+                f"KIS {label} API error: [{data.get('msg_cd')}] {data.get('msg1')}"
             )
+        return data
 
-        items = [BalanceItem(**item) for item in data.get("output1", [])]
-
+    @staticmethod
+    def _totals_block(data: dict) -> dict:
+        """Return the totals block (``output2``) of an ``inquire-balance`` response."""
         totals = data.get("output2", [{}])
-        total_block = totals[0] if isinstance(totals, list) and totals else totals
+        return totals[0] if isinstance(totals, list) and totals else totals
 
+    @classmethod
+    def _parse_balance(cls, data: dict) -> AccountBalance:
+        """Build an :class:`AccountBalance` from an ``inquire-balance`` response."""
+        items = _BALANCE_ITEMS.validate_python(data.get("output1", []))
+        total_block = cls._totals_block(data)
         return AccountBalance(
             items=items,
             total_evlu_amt=total_block.get("tot_evlu_amt", "0"),
             total_evlu_pfls_amt=total_block.get("evlu_pfls_smtl_amt", "0"),
         )
 
+    async def get_balance(self) -> AccountBalance:
+        """Fetch current account balance and holdings.
+
+        Returns:
+            Parsed :class:`AccountBalance` containing individual
+            :class:`BalanceItem` entries and totals.
+        """
+        return self._parse_balance(await self._inquire_balance("balance"))
+
     async def get_available_cash(self) -> int:
         """Fetch available cash from the balance endpoint.
 
@@ -414,43 +719,29 @@ class KISClient:
         Returns:
             Available cash as an integer (KRW).
         """
-        tr_id = get_tr_id("balance", self.config.trading_mode)
-        headers = await self._get_headers(tr_id)
-        params = {
-            "CANO": self.config.kis_account_no,
-            "ACNT_PRDT_CD": self.config.kis_acnt_prdt_cd,
-            "AFHR_FLPR_YN": "N",
-            "OFL_YN": "",
-            "INQR_DVSN": "01",
-            "UNPR_DVSN": "01",
-            "FUND_STTL_ICLD_YN": "N",
-            "FNCG_AMT_AUTO_RDPT_YN": "N",
-            "PRCS_DVSN": "01",
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": "",
-        }
-
-        resp = await self._request_with_retry(
-            "GET", ENDPOINTS["balance"], headers=headers, params=params
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        data = await self._inquire_balance("available-cash")
+        return int(self._totals_block(data).get("dnca_tot_amt", "0"))
 
-        if data.get("rt_cd") != "0":
-            raise RuntimeError(
-                f"KIS available-cash API error: [{data.get('msg_cd')}] {data.get('msg1')}"
-            )
+    async def get_balance_and_cash(self) -> tuple[AccountBalance, int]:
+        """Fetch holdings and available cash with a single ``inquire-balance`` call.
 
-        totals = data.get("output2", [{}])
-        total_block = totals[0] if isinstance(totals, list) and totals else totals
-        return int(total_block.get("dnca_tot_amt", "0"))
+        Returns:
+            Tuple of parsed :class:`AccountBalance` and available cash (KRW).
+        """
+        data = await self._inquire_balance("balance")
+        return self._parse_balance(data), int(self._totals_block(data).get("dnca_tot_amt", "0"))
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
     async def close(self) -> None:
-        """Close the underlying httpx client and release resources."""
+        """Stop the token refresher, close the httpx client and release resources."""
+        if self._refresher_task is not None:
+            self._refresher_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresher_task
+            self._refresher_task = None
         await self.client.aclose()
         logger.info("KIS client closed")
 
@@ -2,12 +2,15 @@
 KIS Open API endpoint definitions and transaction ID mappings.
 """
 
+from functools import lru_cache
+
 ENDPOINTS = {
     "token": "/oauth2/tokenP",
     "approval": "/oauth2/Approval",
     "hashkey": "/uapi/hashkey",
     "price": "/uapi/domestic-stock/v1/quotations/inquire-price",
     "daily_price": "/uapi/domestic-stock/v1/quotations/inquire-daily-price",
+    "multi_price": "/uapi/domestic-stock/v1/quotations/intstock-multprice",
     "order": "/uapi/domestic-stock/v1/trading/order-cash",
     "order_modify": "/uapi/domestic-stock/v1/trading/order-rvsecncl",
     "balance": "/uapi/domestic-stock/v1/trading/inquire-balance",
@@ -27,9 +30,12 @@ TR_IDS = {
     ("available_cash", "paper"): "VTTC8908R",
     ("price", "any"): "FHKST01010100",
     ("daily_price", "any"): "FHKST01010400",
+    # Multi-stock quote is only served by the live server
+    ("multi_price", "live"): "FHKST11300006",
 }
 
 
+@lru_cache(maxsize=32)
 def get_tr_id(operation: str, mode: str) -> str:
     """
     Look up the transaction ID for the given operation and trading mode.
@@ -39,7 +45,7 @@ def get_tr_id(operation: str, mode: str) -> str:
 
     Args:
         operation: One of 'buy', 'sell', 'modify', 'balance',
-                   'available_cash', 'price', 'daily_price'.
+                   'available_cash', 'price', 'daily_price', 'multi_price'.
         mode: Trading mode — 'live' or 'paper'.
 
     Returns:
@@ -6,6 +6,8 @@ Field names follow the KIS API response schema exactly.
 
 from __future__ import annotations
 
+from functools import cached_property
+
 from pydantic import BaseModel, Field
 
 
@@ -42,6 +44,15 @@ class StockPrice(BaseModel):
     class Config:
         extra = "allow"
 
+    @classmethod
+    def from_kis(cls, data: dict) -> StockPrice:
+        """Build from a trusted KIS ``output`` block, skipping validation.
+
+        KIS quote fields are always strings; missing ones default to ``""``.
+        Undeclared fields are dropped.
+        """
+        return cls.model_construct(**{name: data.get(name, "") for name in cls.model_fields})
+
 
 class DailyPrice(BaseModel):
     """Single-day OHLCV entry from inquire-daily-price."""
@@ -55,7 +66,8 @@ class DailyPrice(BaseModel):
     prdy_ctrt: str = Field(default="", description="Previous-day change rate (%)")
 
     class Config:
-        extra = "allow"
+        # Only the fields above are read; don't carry the other ~10 per bar
+        extra = "ignore"
 
 
 # ---------------------------------------------------------------------------
@@ -97,6 +109,11 @@ class BalanceItem(BaseModel):
     class Config:
         extra = "allow"
 
+    @cached_property
+    def hldg_qty_int(self) -> int:
+        """Holding quantity as an integer (parsed once per item)."""
+        return int(self.hldg_qty)
+
 
 class AccountBalance(BaseModel):
     """Aggregated account balance from inquire-balance."""
@@ -16,11 +16,14 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
+from dataclasses import dataclass
 from typing import Any, Callable, Awaitable
 
 import httpx
 import websockets
 from websockets.asyncio.client import connect as ws_connect
+from websockets.exceptions import ConnectionClosedOK
 
 from kis.endpoints import ENDPOINTS
 
@@ -39,14 +42,38 @@ F_HIGH = 8         # STCK_HGPR
 F_LOW = 9          # STCK_LWPR
 F_VOLUME = 13      # ACML_VOL (accumulated volume)
 
+# Leading "encrypted|tr_id|" of an unencrypted real-time price message
+_PRICE_MSG_PREFIX = b"0|H0STCNT0|"
+
+
+@dataclass(slots=True, frozen=True)
+class Tick:
+    """One real-time execution price update (all values as sent by KIS)."""
+
+    stock_code: str
+    price: str
+    change_sign: str
+    change_amount: str
+    change_rate: str
+    open: str
+    high: str
+    low: str
+    volume: str
+
+
 # Type alias for the callback
-PriceCallback = Callable[[dict[str, str]], Awaitable[None]]
+PriceCallback = Callable[[Tick], Awaitable[None]]
 
 
 class KISWebSocket:
     """Async KIS WebSocket client for real-time price streaming."""
 
     TR_ID = "H0STCNT0"  # 주식체결 (real-time execution price)
+    TICK_QUEUE_SIZE = 1024  # ticks buffered for the callback before the oldest is dropped
+    APPROVAL_KEY_TTL = 23 * 3600  # seconds; KIS approval keys are valid for about a day
+    # Subscribe frames sent back-to-back before pausing SUBSCRIBE_PAUSE seconds
+    SUBSCRIBE_BURST = 10
+    SUBSCRIBE_PAUSE = 0.1
 
     def __init__(
         self,
@@ -56,38 +83,59 @@ class KISWebSocket:
         self.config = config
         self.on_price = on_price
         self._approval_key: str | None = None
+        self._approval_expires: float = 0.0
         self._ws: Any = None
         self._subscribed: set[str] = set()
+        # Encoded subscribe/unsubscribe messages by (stock_code, subscribe);
+        # reused on every reconnect while the approval key stays the same
+        self._sub_msgs: dict[tuple[str, bool], str] = {}
+        # Kept open so reconnects reuse the connection instead of a new TLS handshake
+        self._http = httpx.AsyncClient(
+            base_url=config.kis_base_url,
+            timeout=10.0,
+            transport=httpx.AsyncHTTPTransport(http2=True, retries=2),
+        )
 
     # ------------------------------------------------------------------
     # Approval key (WebSocket authentication)
     # ------------------------------------------------------------------
 
     async def _get_approval_key(self) -> str:
-        """Obtain WebSocket approval key from KIS REST API."""
-        if self._approval_key:
+        """Obtain WebSocket approval key from KIS REST API (cached until near expiry)."""
+        if self._approval_key and time.monotonic() < self._approval_expires:
             return self._approval_key
 
-        async with httpx.AsyncClient(base_url=self.config.kis_base_url, timeout=10.0) as client:
-            resp = await client.post(
-                ENDPOINTS["approval"],
-                json={
-                    "grant_type": "client_credentials",
-                    "appkey": self.config.kis_app_key,
-                    "secretkey": self.config.kis_app_secret,
-                },
-            )
-            resp.raise_for_status()
-            self._approval_key = resp.json()["approval_key"]
-            logger.info("KIS WebSocket approval key acquired")
-            return self._approval_key
+        resp = await self._http.post(
+            ENDPOINTS["approval"],
+            json={
+                "grant_type": "client_credentials",
+                "appkey": self.config.kis_app_key,
+                "secretkey": self.config.kis_app_secret,
+            },
+        )
+        resp.raise_for_status()
+        self._approval_key = resp.json()["approval_key"]
+        self._approval_expires = time.monotonic() + self.APPROVAL_KEY_TTL
+        # Cached subscribe messages embed the old key
+        self._sub_msgs.clear()
+        logger.info("KIS WebSocket approval key acquired")
+        return self._approval_key
 
     # ------------------------------------------------------------------
     # Subscribe / unsubscribe
     # ------------------------------------------------------------------
 
     def _build_subscribe_msg(self, stock_code: str, subscribe: bool = True) -> str:
-        """Build a JSON subscribe/unsubscribe message."""
+        """Build (or reuse) a JSON subscribe/unsubscribe message."""
+        msg = self._sub_msgs.get((stock_code, subscribe))
+        if msg is None:
+            msg = self._sub_msgs[(stock_code, subscribe)] = self._encode_subscribe_msg(
+                stock_code, subscribe
+            )
+        return msg
+
+    def _encode_subscribe_msg(self, stock_code: str, subscribe: bool) -> str:
+        """Encode a subscribe/unsubscribe message for the current approval key."""
         return json.dumps({
             "header": {
                 "approval_key": self._approval_key,
@@ -107,70 +155,79 @@ class KISWebSocket:
         """Subscribe to real-time prices for given stock codes."""
         if not self._ws:
             return
-        for code in stock_codes:
-            if code in self._subscribed:
-                continue
+        new_codes = [code for code in dict.fromkeys(stock_codes) if code not in self._subscribed]
+        for i, code in enumerate(new_codes):
+            # Frames go out back-to-back; pause only between bursts
+            if i and i % self.SUBSCRIBE_BURST == 0:
+                await asyncio.sleep(self.SUBSCRIBE_PAUSE)
             await self._ws.send(self._build_subscribe_msg(code, subscribe=True))
             self._subscribed.add(code)
-            logger.info("Subscribed to real-time price: %s", code)
-            await asyncio.sleep(0.1)  # small delay between subscriptions
+        if new_codes:
+            logger.info("Subscribed to real-time prices: %s", ", ".join(new_codes))
 
     # ------------------------------------------------------------------
     # Message parsing
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _parse_price_message(raw: str) -> dict[str, str] | None:
-        """Parse a pipe-delimited price message into a dict.
+    def _parse_price_message(raw: bytes | str) -> Tick | None:
+        """Parse a pipe-delimited price message into a :class:`Tick`.
 
         Format: "encrypted|tr_id|count|data"
         Data is ^-delimited fields.
         Returns None if not a price data message.
+
+        Works on the raw frame bytes; only the returned fields are decoded.
         """
-        parts = raw.split("|")
-        if len(parts) < 4:
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        # Cheap prefix gate: only unencrypted H0STCNT0 data messages qualify
+        if not raw.startswith(_PRICE_MSG_PREFIX):
             return None
-
-        encrypted = parts[0]
-        tr_id = parts[1]
-
-        # Only handle unencrypted price messages
-        if encrypted != "0" or tr_id != "H0STCNT0":
+        parts = raw.split(b"|", 3)
+        if len(parts) < 4:
             return None
 
-        fields = parts[3].split("^")
+        # Only split as far as the last field we read
+        fields = parts[3].split(b"^", F_VOLUME + 1)
         if len(fields) <= F_VOLUME:
             return None
 
-        return {
-            "stock_code": fields[F_STOCK_CODE],
-            "price": fields[F_PRICE],
-            "change_sign": fields[F_SIGN],
-            "change_amount": fields[F_CHANGE],
-            "change_rate": fields[F_CHANGE_RATE],
-            "open": fields[F_OPEN],
-            "high": fields[F_HIGH],
-            "low": fields[F_LOW],
-            "volume": fields[F_VOLUME],
-        }
+        return Tick(
+            fields[F_STOCK_CODE].decode(),
+            fields[F_PRICE].decode(),
+            fields[F_SIGN].decode(),
+            fields[F_CHANGE].decode(),
+            fields[F_CHANGE_RATE].decode(),
+            fields[F_OPEN].decode(),
+            fields[F_HIGH].decode(),
+            fields[F_LOW].decode(),
+            fields[F_VOLUME].decode(),
+        )
 
     # ------------------------------------------------------------------
     # Main loop
     # ------------------------------------------------------------------
 
-    async def run(self, stock_codes: list[str]) -> None:
+    async def run(self, stock_codes: list[str] | None = None) -> None:
         """Connect, subscribe, and stream prices indefinitely.
 
-        Reconnects automatically on disconnection.
+        Reconnects automatically on disconnection. Without explicit
+        *stock_codes*, each (re)connect subscribes to the current
+        ``config.watchlist``.
         """
         while True:
             try:
-                await self._connect_and_stream(stock_codes)
+                await self._connect_and_stream(
+                    stock_codes if stock_codes is not None else self.config.watchlist
+                )
             except Exception as e:
                 logger.warning("KIS WebSocket disconnected: %s. Reconnecting in 5s...", e)
+                await asyncio.sleep(5)
+            finally:
+                # Subscriptions belong to the closed connection
                 self._ws = None
                 self._subscribed.clear()
-                await asyncio.sleep(5)
 
     async def _connect_and_stream(self, stock_codes: list[str]) -> None:
         """Single connection lifecycle: connect, subscribe, read messages."""
@@ -186,22 +243,48 @@ class KISWebSocket:
             # Subscribe to all watchlist stocks
             await self.subscribe(stock_codes)
 
-            # Read messages
-            async for message in ws:
-                if isinstance(message, bytes):
-                    message = message.decode("utf-8", errors="replace")
+            # Reading and dispatching are decoupled so a slow callback never
+            # stalls the socket; the dispatcher stops with the connection
+            queue: asyncio.Queue[Tick] = asyncio.Queue(maxsize=self.TICK_QUEUE_SIZE)
+            dispatcher = asyncio.create_task(self._dispatch_prices(queue))
+            try:
+                await self._read_prices(ws, queue)
+            finally:
+                dispatcher.cancel()
+
+    async def _read_prices(self, ws: Any, queue: asyncio.Queue[Tick]) -> None:
+        """Read frames until the connection closes, queueing parsed price ticks.
 
-                # Try to parse as price data
-                price = self._parse_price_message(message)
-                if price and self.on_price:
-                    try:
-                        await self.on_price(price)
-                    except Exception as e:
-                        logger.error("Price callback error: %s", e)
+        When the queue is full the oldest tick is dropped, keeping latency bounded.
+        """
+        while True:
+            # Read messages as raw bytes (text frames are not UTF-8 decoded;
+            # the parser decodes only the fields it returns)
+            try:
+                message = await ws.recv(decode=False)
+            except ConnectionClosedOK:
+                return
+
+            # Try to parse as price data
+            price = self._parse_price_message(message)
+            if price and self.on_price:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(price)
+
+    async def _dispatch_prices(self, queue: asyncio.Queue[Tick]) -> None:
+        """Hand queued price ticks to the callback, one at a time."""
+        while True:
+            price = await queue.get()
+            try:
+                await self.on_price(price)
+            except Exception as e:
+                logger.error("Price callback error: %s", e)
 
     async def close(self) -> None:
-        """Close the WebSocket connection."""
+        """Close the WebSocket connection and the approval-key HTTP client."""
         if self._ws:
             await self._ws.close()
             self._ws = None
             logger.info("KIS WebSocket closed")
+        await self._http.aclose()
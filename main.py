@@ -11,13 +11,19 @@ from typing import List
 
 import uvicorn
 
-from config import Config
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+from config import Config, get_config
 from kis.client import KISClient
-from kis.ws_client import KISWebSocket
+from kis.ws_client import KISWebSocket, Tick
 from agents.data_collector import DataCollectorAgent
 from agents.data_analyst import DataAnalystAgent
 from agents.trade_executor import TradeExecutorAgent
 from agents.risk_manager import RiskManagerAgent
+from agents.report import ReportManager
 from server.app import create_app
 from server.routes import set_kis_ws
 
@@ -61,9 +67,34 @@ async def run_agent_loop(agent, interval: int) -> None:
     try:
         await agent.run(interval)
     except asyncio.CancelledError:
-        logger.info(f"Agent {agent.name} stopped")
+        logger.info("Agent %s stopped", agent.name)
     except Exception as e:
-        logger.error(f"Agent {agent.name} fatal error: {e}", exc_info=True)
+        logger.error("Agent %s fatal error: %s", agent.name, e, exc_info=True)
+
+
+async def run_report_pruner(config: Config, interval: int = 3600) -> None:
+    """Periodically delete (or archive) reports older than the configured retention period."""
+    logger = logging.getLogger("main.report_pruner")
+    report_manager = ReportManager("report_pruner")
+    try:
+        while True:
+            try:
+                removed = await asyncio.to_thread(
+                    report_manager.prune_reports,
+                    config.report_retention_days,
+                    config.report_archive,
+                )
+                if removed:
+                    logger.info(
+                        "%s %d report(s) older than %d days",
+                        "Archived" if config.report_archive else "Pruned",
+                        removed, config.report_retention_days,
+                    )
+            except Exception as e:
+                logger.error("Report pruning failed: %s", e, exc_info=True)
+            await asyncio.sleep(interval)
+    except asyncio.CancelledError:
+        logger.info("Report pruner stopped")
 
 
 async def run_server(app, config: Config) -> None:
@@ -72,7 +103,13 @@ async def run_server(app, config: Config) -> None:
         app,
         host="0.0.0.0",
         port=config.api_port,
-        log_level=config.log_level.lower()
+        log_level=config.log_level.lower(),
+        # httptools is picked up automatically when installed (uvicorn[standard]);
+        # the event loop is chosen in __main__, since the server runs inside main()'s loop.
+        # The frontend only sends tiny messages, so cap inbound frames at 1 MiB
+        ws_max_size=1 << 20,
+        ws_ping_interval=30,
+        ws_ping_timeout=20,
     )
     server = uvicorn.Server(server_config)
 
@@ -82,8 +119,8 @@ async def run_server(app, config: Config) -> None:
 
 async def main() -> None:
     """Main application entry point."""
-    # Initialize config
-    config = Config()
+    # Initialize config (loads .env)
+    config = get_config()
     config.validate()
 
     # Setup logging
@@ -94,12 +131,13 @@ async def main() -> None:
     print_banner(config)
 
     kis_client = None
+    kis_ws = None
     tasks: List[asyncio.Task] = []
     loop = asyncio.get_running_loop()
 
     # Signal handlers - cancel tasks directly from event loop
     def handle_shutdown(sig_name: str):
-        logger.info(f"Received {sig_name}, initiating shutdown...")
+        logger.info("Received %s, initiating shutdown...", sig_name)
         for task in tasks:
             if not task.done():
                 task.cancel()
@@ -120,7 +158,7 @@ async def main() -> None:
             TradeExecutorAgent("trade_executor", config, kis_client),
             RiskManagerAgent("risk_manager", config, kis_client)
         ]
-        logger.info(f"Created {len(agents)} agents")
+        logger.info("Created %d agents", len(agents))
 
         # Create FastAPI app
         app, ws_manager = create_app(agents, kis_client, config)
@@ -131,15 +169,15 @@ async def main() -> None:
             agent._ws_manager = ws_manager
 
         # Create KIS real-time price stream
-        async def on_price_tick(price: dict) -> None:
-            """Relay KIS price ticks to frontend via WebSocket."""
-            await ws_manager.broadcast("price_update", price)
+        async def on_price_tick(tick: Tick) -> None:
+            """Relay KIS price ticks to frontend via WebSocket (coalesced)."""
+            ws_manager.queue_price(tick)
 
         kis_ws = KISWebSocket(config, on_price=on_price_tick)
         set_kis_ws(kis_ws)
 
         tasks.append(asyncio.create_task(
-            kis_ws.run(config.watchlist),
+            kis_ws.run(),
             name="kis_websocket"
         ))
         logger.info("KIS real-time price stream started for %s", config.watchlist)
@@ -162,6 +200,13 @@ async def main() -> None:
             name="risk_manager"
         ))
 
+        # Create report retention task
+        if config.report_retention_days > 0:
+            tasks.append(asyncio.create_task(
+                run_report_pruner(config),
+                name="report_pruner"
+            ))
+
         # Create server task
         tasks.append(asyncio.create_task(
             run_server(app, config),
@@ -174,7 +219,7 @@ async def main() -> None:
         await asyncio.gather(*tasks, return_exceptions=True)
 
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
 
     finally:
         # Cleanup - cancel any remaining tasks
@@ -184,6 +229,10 @@ async def main() -> None:
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
 
+        # Close KIS WebSocket stream
+        if kis_ws:
+            await kis_ws.close()
+
         # Close KIS client
         if kis_client:
             await kis_client.__aexit__(None, None, None)
@@ -194,7 +243,10 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\nShutdown requested by user")
     except Exception as e:
@@ -6,6 +6,40 @@ from server.routes import router, init_routes
 
 logger = logging.getLogger(__name__)
 
+# Write-buffer high-water mark for frontend WebSockets: bursty broadcasts queue
+# in the transport instead of forcing a drain at the server's small default
+_WS_HIGH_WATER = 1 << 20
+_WS_LOW_WATER = 256 * 1024
+
+
+class WebSocketWriteBufferMiddleware:
+    """Raise the transport write-buffer limits of each accepted WebSocket.
+
+    Starlette wraps the ASGI ``send`` callable before it reaches the endpoint,
+    so this has to sit outside it to find the server protocol's transport.
+    Servers that don't expose one are left untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "websocket":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            await send(message)
+            if message["type"] == "websocket.accept":
+                transport = getattr(getattr(send, "__self__", None), "transport", None)
+                try:
+                    transport.set_write_buffer_limits(high=_WS_HIGH_WATER, low=_WS_LOW_WATER)
+                except AttributeError:
+                    pass
+
+        await self.app(scope, receive, send_wrapper)
+
+
 def create_app(agents, kis_client, config) -> tuple[FastAPI, WebSocketManager]:
     app = FastAPI(title="Agent Trading Company", version="1.0.0")
 
@@ -18,6 +52,8 @@ def create_app(agents, kis_client, config) -> tuple[FastAPI, WebSocketManager]:
         allow_headers=["*"],
     )
 
+    app.add_middleware(WebSocketWriteBufferMiddleware)
+
     # Initialize routes with dependencies
     init_routes(agents, kis_client, config)
     app.include_router(router)
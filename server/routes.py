@@ -2,13 +2,17 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 import re
 import asyncio
-from agents.report import ReportManager
+from pathlib import Path
+import orjson
+from agents.report import KNOWN_AGENTS, ReportManager
 from agents.market_schedule import get_market_status
+from config import _save_watchlist_file
 
 router = APIRouter(prefix="/api")
 
 # These will be set by app.py
 _agents = []
+_agents_by_name = {}
 _kis_client = None
 _config = None
 _kis_ws = None
@@ -19,15 +23,28 @@ def set_kis_ws(kis_ws):
     _kis_ws = kis_ws
 
 
+_STOCK_CODE_RE = re.compile(r"\d{6}")
+# Serializes watchlist file writes so they land in request order
+_watchlist_save_lock = asyncio.Lock()
+
+
 class WatchlistAddRequest(BaseModel):
     stock_code: str
 
 def init_routes(agents, kis_client, config):
-    global _agents, _kis_client, _config
+    global _agents, _agents_by_name, _kis_client, _config
     _agents = agents
+    _agents_by_name = {agent.name: agent for agent in agents}
     _kis_client = kis_client
     _config = config
 
+
+async def _persist_watchlist(watchlist: list[str]) -> None:
+    """Write the watchlist file off the event loop."""
+    async with _watchlist_save_lock:
+        await asyncio.to_thread(_save_watchlist_file, watchlist)
+
+
 @router.get("/watchlist")
 async def get_watchlist():
     """Return the current watchlist."""
@@ -43,21 +60,21 @@ async def add_to_watchlist(req: WatchlistAddRequest):
         raise HTTPException(503, "Config not available")
 
     code = req.stock_code.strip()
-    if not re.fullmatch(r"\d{6}", code):
+    if not _STOCK_CODE_RE.fullmatch(code):
         raise HTTPException(400, "Stock code must be exactly 6 digits")
     if code in _config.watchlist:
         raise HTTPException(409, f"{code} is already in the watchlist")
 
-    _config.watchlist.append(code)
-
-    from config import _save_watchlist_file
-    _save_watchlist_file(_config.watchlist)
+    # Copy-on-write: readers iterating the old list are unaffected
+    watchlist = _config.watchlist + [code]
+    _config.watchlist = watchlist
+    await _persist_watchlist(watchlist)
 
     # Subscribe to real-time prices if WebSocket is available
     if _kis_ws:
         asyncio.create_task(_kis_ws.subscribe([code]))
 
-    return {"watchlist": _config.watchlist}
+    return {"watchlist": watchlist}
 
 
 @router.delete("/watchlist/{stock_code}")
@@ -69,12 +86,11 @@ async def remove_from_watchlist(stock_code: str):
     if stock_code not in _config.watchlist:
         raise HTTPException(404, f"{stock_code} is not in the watchlist")
 
-    _config.watchlist.remove(stock_code)
-
-    from config import _save_watchlist_file
-    _save_watchlist_file(_config.watchlist)
+    watchlist = [code for code in _config.watchlist if code != stock_code]
+    _config.watchlist = watchlist
+    await _persist_watchlist(watchlist)
 
-    return {"watchlist": _config.watchlist}
+    return {"watchlist": watchlist}
 
 @router.get("/agents")
 async def get_agents():
@@ -82,7 +98,7 @@ async def get_agents():
 
 @router.get("/agents/{name}")
 async def get_agent(name: str):
-    agent = next((a for a in _agents if a.name == name), None)
+    agent = _agents_by_name.get(name)
     if not agent:
         raise HTTPException(404, f"Agent {name} not found")
     return agent.get_status()
@@ -90,46 +106,111 @@ async def get_agent(name: str):
 @router.get("/reports")
 async def get_all_reports(limit: int = 30):
     """Get all reports from all agents in reverse chronological order."""
-    from pathlib import Path
-    agent_names = ["data_collector", "data_analyst", "trade_executor", "risk_manager"]
-    all_reports = []
+    agent_names = list(_agents_by_name) or KNOWN_AGENTS
     rm = ReportManager("_")  # Just to get reports_dir
-    for agent_name in agent_names:
-        agent_dir = rm.reports_dir / agent_name
-        if not agent_dir.exists():
-            continue
-        for filepath in agent_dir.glob("*.md"):
-            all_reports.append({
-                "filename": filepath.name,
-                "agent": agent_name,
-                "content": filepath.read_text(encoding="utf-8"),
-            })
-    # Sort by filename (which is timestamp-based) in reverse chronological order
-    all_reports.sort(key=lambda r: r["filename"], reverse=True)
-    return all_reports[:limit]
+    # Pick the newest `limit` by filename (timestamp) first, then read only those;
+    # directory scans and file reads run in worker threads
+    candidates = await asyncio.to_thread(_newest_report_names, rm, agent_names, limit)
+    contents = await asyncio.gather(
+        *[asyncio.to_thread(rm.read_report, agent_name, filename) for filename, agent_name in candidates]
+    )
+    return [
+        {"filename": filename, "agent": agent_name, "content": content}
+        for (filename, agent_name), content in zip(candidates, contents)
+    ]
+
+
+def _newest_report_names(rm: ReportManager, agent_names: list[str], limit: int) -> list[tuple[str, str]]:
+    """Return (filename, agent) for the newest `limit` reports across agents."""
+    candidates = [
+        (filename, agent_name)
+        for agent_name in agent_names
+        for filename in rm.list_reports(agent_name, limit)
+    ]
+    candidates.sort(reverse=True)
+    return candidates[:limit]
 
 @router.get("/agents/{name}/reports")
 async def get_agent_reports(name: str, limit: int = 10):
     rm = ReportManager(name)
-    filenames = rm.list_reports(name)[:limit]
+    filenames = rm.list_reports(name, limit)
     return [{"filename": f, "agent": name} for f in filenames]
 
 @router.get("/agents/{name}/reports/{filename}")
 async def get_report_content(name: str, filename: str):
     rm = ReportManager(name)
-    from pathlib import Path
     filepath = rm.reports_dir / name / filename
     if not filepath.exists():
         raise HTTPException(404, "Report not found")
-    return {"filename": filename, "agent": name, "content": filepath.read_text(encoding="utf-8")}
+    content = await asyncio.to_thread(rm.read_report, name, filename)
+    return {"filename": filename, "agent": name, "content": content}
+
+# Parsed trades per trade_executor report: filename -> ((mtime_ns, size), trades)
+_trade_cache: dict[str, tuple[tuple[int, int], list[dict]]] = {}
+_DATA_RE = re.compile(r'## Data\n(.*?)\n\n##', re.DOTALL)
+_TRADE_STATUS = {
+    "success": "filled",
+    "failed": "failed",
+    "skipped": "failed",
+}
+
+
+def _parse_trades(content: str, timestamp_iso: str) -> list[dict]:
+    """Extract trade rows from the Data section of a trade_executor report."""
+    data_match = _DATA_RE.search(content)
+    if not data_match:
+        return []
+
+    data_section = data_match.group(1).strip()
+    if not data_section or data_section == "[]":
+        return []
+
+    trades = []
+    for item in orjson.loads(data_section):
+        order = item.get("order", {})
+        result = item.get("result", "failed")
+        trades.append({
+            "timestamp": timestamp_iso,
+            "stock_code": order.get("stock_code", ""),
+            "stock_name": order.get("stock_code", ""),
+            "action": order.get("action", "buy"),
+            "qty": order.get("qty", 0),
+            "price": order.get("price", 0),
+            "status": _TRADE_STATUS.get(result, "failed"),
+        })
+    return trades
+
+
+def _report_trades(filepath: Path) -> list[dict]:
+    """Trades recorded in one report, re-parsed only when the file changed."""
+    parts = filepath.stem.split("_")
+    if len(parts) != 2:
+        return []
+    st = filepath.stat()
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _trade_cache.get(filepath.name)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    timestamp_iso = f"{parts[0]}T{parts[1].replace('-', ':')}"
+    try:
+        trades = _parse_trades(filepath.read_text(encoding="utf-8"), timestamp_iso)
+    except (ValueError, KeyError):
+        trades = []
+    _trade_cache[filepath.name] = (version, trades)
+    return trades
+
 
 @router.get("/trades")
 async def get_trades(limit: int = 20):
     """Get recent trades from executor reports."""
-    import json
-    import re
-
     rm = ReportManager("trade_executor")
+    # Report scanning and parsing is blocking file I/O; keep it off the event loop
+    return await asyncio.to_thread(_collect_trades, rm, limit)
+
+
+def _collect_trades(rm: ReportManager, limit: int) -> list[dict]:
+    """Collect the newest `limit` trades from trade_executor reports."""
     agent_dir = rm.reports_dir / "trade_executor"
 
     if not agent_dir.exists():
@@ -137,59 +218,24 @@ async def get_trades(limit: int = 20):
 
     trades = []
 
-    # Scan ALL report files (sorted newest first) and collect actual trades
-    report_files = sorted(agent_dir.glob("*.md"), reverse=True)
-
-    for filepath in report_files:
+    # Scan report files newest first until enough trades are collected;
+    # already-parsed, unchanged reports come from the cache
+    filenames = rm.list_reports("trade_executor")
+    for filename in filenames:
         try:
-            filename = filepath.stem
-            parts = filename.split("_")
-            if len(parts) == 2:
-                date_part = parts[0]
-                time_part = parts[1].replace("-", ":")
-                timestamp_iso = f"{date_part}T{time_part}"
-            else:
-                continue
-
-            content = filepath.read_text(encoding="utf-8")
-
-            data_match = re.search(r'## Data\n(.*?)\n\n##', content, re.DOTALL)
-            if not data_match:
-                continue
-
-            data_section = data_match.group(1).strip()
-            if not data_section or data_section == "[]":
-                continue
-
-            orders_data = json.loads(data_section)
-
-            for item in orders_data:
-                order = item.get("order", {})
-                result = item.get("result", "failed")
-
-                status_map = {
-                    "success": "filled",
-                    "failed": "failed",
-                    "skipped": "failed",
-                }
-                trade = {
-                    "timestamp": timestamp_iso,
-                    "stock_code": order.get("stock_code", ""),
-                    "stock_name": order.get("stock_code", ""),
-                    "action": order.get("action", "buy"),
-                    "qty": order.get("qty", 0),
-                    "price": order.get("price", 0),
-                    "status": status_map.get(result, "failed"),
-                }
-                trades.append(trade)
-
-        except (json.JSONDecodeError, ValueError, KeyError):
+            trades.extend(_report_trades(agent_dir / filename))
+        except OSError:
             continue
 
         # Stop scanning once we have enough trades
         if len(trades) >= limit:
             break
 
+    # Forget reports that were pruned
+    if len(_trade_cache) > len(filenames):
+        for name in _trade_cache.keys() - set(filenames):
+            _trade_cache.pop(name, None)
+
     trades.sort(key=lambda t: t["timestamp"], reverse=True)
     return trades[:limit]
 
@@ -219,29 +265,46 @@ async def get_config():
 
 @router.get("/prices")
 async def get_prices():
-    """Get current prices for all stocks in the watchlist (sequential to avoid rate limits)."""
+    """Get current prices for all stocks in the watchlist.
+
+    Quotes are fetched in one batched call (concurrent requests on the paper
+    server); the KIS client enforces the rate limit.
+    """
     if not _kis_client:
         raise HTTPException(503, "KIS client not available")
     if not _config:
         raise HTTPException(503, "Config not available")
 
+    watchlist = _config.watchlist  # replaced, never mutated, by the watchlist routes
+    try:
+        # Codes missing from the batch already failed an individual get_price
+        quotes = await _kis_client.get_prices_batch(watchlist)
+    except Exception:
+        # Nothing was fetched, so try every code one by one
+        results = await asyncio.gather(
+            *[_kis_client.get_price(code) for code in watchlist], return_exceptions=True
+        )
+        quotes = {
+            code: result for code, result in zip(watchlist, results)
+            if not isinstance(result, Exception)
+        }
+
     prices = []
-    for stock_code in _config.watchlist:
-        try:
-            result = await _kis_client.get_price(stock_code)
-            prices.append({
-                "stock_code": stock_code,
-                "price": result.stck_prpr,
-                "open": result.stck_oprc,
-                "high": result.stck_hgpr,
-                "low": result.stck_lwpr,
-                "volume": result.acml_vol,
-                "change_rate": result.prdy_ctrt,
-                "change_amount": result.prdy_vrss,
-                "change_sign": result.prdy_vrss_sign,
-            })
-        except Exception:
+    for stock_code in watchlist:
+        result = quotes.get(stock_code)
+        if result is None:
             continue
+        prices.append({
+            "stock_code": stock_code,
+            "price": result.stck_prpr,
+            "open": result.stck_oprc,
+            "high": result.stck_hgpr,
+            "low": result.stck_lwpr,
+            "volume": result.acml_vol,
+            "change_rate": result.prdy_ctrt,
+            "change_amount": result.prdy_vrss,
+            "change_sign": result.prdy_vrss_sign,
+        })
 
     return prices
 
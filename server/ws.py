@@ -1,31 +1,86 @@
 import asyncio
-import json
+import contextlib
 import logging
+from typing import Any
+import orjson
 from fastapi import WebSocket
+from kis.ws_client import Tick
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded envelope for the high-frequency price event (same JSON as broadcast())
+_PRICE_UPDATES_PREFIX = '{"type":"price_updates","data":'
+
 class WebSocketManager:
+    # Price ticks arriving within this window (seconds) go out as one message
+    PRICE_FLUSH_INTERVAL = 0.05
+    # A client that can't take a message within this many seconds is dropped,
+    # so one stalled socket can't hold up every broadcast
+    SEND_TIMEOUT = 5.0
+
     def __init__(self):
-        self.connections: list[WebSocket] = []
+        self.connections: set[WebSocket] = set()
+        # Latest pending tick per stock code, flushed as one "price_updates" event
+        self._pending_prices: dict[str, Tick] = {}
+        self._flush_task: asyncio.Task | None = None
+        # Close handshakes for timed-out clients, referenced until they finish
+        self._close_tasks: set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.connections.append(websocket)
-        logger.info(f"WebSocket connected. Total: {len(self.connections)}")
+        self.connections.add(websocket)
+        logger.info("WebSocket connected. Total: %d", len(self.connections))
 
     def disconnect(self, websocket: WebSocket):
-        self.connections.remove(websocket)
-        logger.info(f"WebSocket disconnected. Total: {len(self.connections)}")
-
-    async def broadcast(self, event_type: str, data: dict):
-        """Send event to all connected clients."""
-        message = json.dumps({"type": event_type, "data": data}, default=str, ensure_ascii=False)
-        disconnected = []
-        for ws in self.connections:
-            try:
-                await ws.send_text(message)
-            except Exception:
-                disconnected.append(ws)
-        for ws in disconnected:
-            self.connections.remove(ws)
+        self.connections.discard(websocket)
+        logger.info("WebSocket disconnected. Total: %d", len(self.connections))
+
+    async def broadcast(self, event_type: str, data: Any):
+        """Send event to all connected clients concurrently."""
+        # Sent as a text frame so the frontend can JSON.parse(event.data) directly
+        message = orjson.dumps(
+            {"type": event_type, "data": data}, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+        await self._send_all(message)
+
+    async def _send_all(self, message: str):
+        """Send an encoded message to every client, dropping the ones that fail."""
+        connections = list(self.connections)
+        results = await asyncio.gather(
+            *[asyncio.wait_for(ws.send_text(message), self.SEND_TIMEOUT) for ws in connections],
+            return_exceptions=True,
+        )
+        failed = {ws for ws, result in zip(connections, results) if isinstance(result, Exception)}
+        if failed:
+            self.connections -= failed
+            logger.info("Dropped %d unresponsive WebSocket(s). Total: %d", len(failed), len(self.connections))
+        # A timed-out socket is still open; close it (1013 = try again later) so the
+        # frontend notices and reconnects instead of silently missing every update
+        for ws, result in zip(connections, results):
+            if isinstance(result, asyncio.TimeoutError):
+                task = asyncio.create_task(self._close_quietly(ws))
+                self._close_tasks.add(task)
+                task.add_done_callback(self._close_tasks.discard)
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket):
+        with contextlib.suppress(Exception):
+            await websocket.close(code=1013)
+
+    def queue_price(self, tick: Tick) -> None:
+        """Queue a price tick; ticks are coalesced and broadcast together shortly after."""
+        self._pending_prices[tick.stock_code] = tick
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_prices())
+
+    async def _flush_prices(self) -> None:
+        """After the coalescing window, broadcast the latest tick of each stock."""
+        await asyncio.sleep(self.PRICE_FLUSH_INTERVAL)
+        pending, self._pending_prices = self._pending_prices, {}
+        # Ticks arriving during the broadcast start the next window
+        self._flush_task = None
+        if not self.connections:
+            return
+        # Only the tick list needs encoding; the envelope is constant
+        data = orjson.dumps(list(pending.values()))
+        await self._send_all(_PRICE_UPDATES_PREFIX + data.decode() + "}")